@@ -87,6 +87,11 @@ st.markdown("""
 if 'IS_CLOUD' not in os.environ:
     os.environ['IS_CLOUD'] = 'true'
 
+# Copy-on-Write: los análisis comparten las columnas base en lugar de copiarlas
+# (siempre activo desde pandas 3.0)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
 # Importar módulos
 try:
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -96,11 +101,44 @@ try:
     
     from data_extractor import DocumentProcessor
     from ml_applications import PsychosocialAnalyzer
+    from record_linkage import RecordLinker
+    from exploratory_sampling import StratifiedSampler, COLUMNAS_DISENO
+    from cohort_index import CohortIndex, FLAGS_DESCRIPCION
+    from columnar import a_columnar, leer_csv, combinar, exportar_csv
+    from visualizations import preparar_graficos, mostrar_visualizaciones
     CLOUD_READY = True
 except ImportError as e:
     st.warning(f"⚠️ Algunas funciones avanzadas no están disponibles: {e}")
     CLOUD_READY = False
 
+# Aplicaciones disponibles: etiqueta -> (clave de resultado, método de PsychosocialAnalyzer)
+ANALISIS_DISPONIBLES = {
+    "🚨 Sistema de Alertas Tempranas": ('alertas', 'alerta_temprana'),
+    "💡 Recomendador de Intervenciones": ('recomendaciones', 'recomendador_intervenciones'),
+    "📊 Análisis de Patrones de Estrés": ('estres', 'patrones_estres'),
+    "🔄 Predictor de Rotación Voluntaria": ('rotacion', 'modelo_rotacion'),
+    "⚠️ Predictor de Incidentes": ('incidentes', 'predictor_incidentes'),
+    "🛡️ Perfiles de Resiliencia": ('resiliencia', 'perfiles_resiliencia'),
+    "📈 Efectividad de Intervenciones": ('efectividad', 'efectividad_intervenciones'),
+    "🏥 Enfermedades Laborales (COLORES)": ('enfermedades_colores', 'detector_enfermedades_colores'),
+    "🔴 Rotación con Alertas (COLORES)": ('rotacion_colores', 'predictor_rotacion_colores'),
+    "🧪 Simulador de Intervenciones": ('simulacion', 'simulador_intervenciones'),
+}
+
+# Columnas que la lectura rápida de Excel conserva aunque no haya análisis seleccionado:
+# el constructor de cohortes ejecuta las apps de colores y el simulador puede elegirse después
+METODOS_SIEMPRE_LEIDOS = ['detector_enfermedades_colores', 'predictor_rotacion_colores',
+                          'simulador_intervenciones']
+
+# Indicadores de riesgo estimados con intervalos de confianza en modo exploratorio
+INDICADORES_RIESGO = {
+    'alertas': ("🚨 Riesgo alto", lambda r: r['riesgo_alto'] == 1),
+    'rotacion': ("🔄 Riesgo de rotación", lambda r: r['riesgo_rotacion'] == 1),
+    'incidentes': ("⚠️ Riesgo de incidentes", lambda r: r['riesgo_incidentes'] == 1),
+    'enfermedades_colores': ("🏥 Enfermedad 🔴 Alto", lambda r: r['riesgo_enfermedad'] == '🔴 Alto'),
+    'rotacion_colores': ("🔴 Rotación 🔴 Alto", lambda r: r['riesgo_rotacion'] == '🔴 Alto'),
+}
+
 # FUNCIÓN PARA LOGO Y CRÉDITOS
 def show_header():
     st.markdown("""
@@ -124,20 +162,39 @@ def main():
         st.subheader("📊 Aplicaciones ML")
         app_selection = st.multiselect(
             "Selecciona análisis a ejecutar:",
-            [
-                "🚨 Sistema de Alertas Tempranas",
-                "💡 Recomendador de Intervenciones", 
-                "📊 Análisis de Patrones de Estrés",
-                "🔄 Predictor de Rotación Voluntaria",
-                "⚠️ Predictor de Incidentes",
-                "🛡️ Perfiles de Resiliencia",
-                "📈 Efectividad de Intervenciones",
-                "🏥 Enfermedades Laborales (COLORES)",
-                "🔴 Rotación con Alertas (COLORES)"
-            ],
+            list(ANALISIS_DISPONIBLES.keys()),
             default=["🚨 Sistema de Alertas Tempranas", "💡 Recomendador de Intervenciones"]
         )
         
+        st.divider()
+        st.subheader("⚡ Ingesta de Excel")
+        excel_rapido = st.checkbox(
+            "Lectura rápida (streaming)",
+            value=True,
+            help="Lee todas las hojas en modo solo lectura y carga únicamente las columnas que usan "
+                 "los análisis seleccionados, el constructor de cohortes y el simulador"
+        )
+        
+        st.divider()
+        st.subheader("🔗 Vinculación de Registros")
+        deduplicar = st.checkbox(
+            "Deduplicar colaboradores entre archivos",
+            value=True,
+            help="Fusiona IDs repetidos y nombres casi idénticos de la misma área"
+        )
+        
+        st.divider()
+        st.subheader("🔬 Modo Exploratorio")
+        modo_exploratorio = st.checkbox(
+            "Analizar una muestra estratificada",
+            value=False,
+            help="Muestra por área y tipo de contrato; las tasas se muestran con intervalos de confianza"
+        )
+        tamano_muestra = st.number_input(
+            "Tamaño de muestra", min_value=100, max_value=50000, value=2000, step=500,
+            disabled=not modo_exploratorio
+        )
+        
         st.divider()
         st.subheader("🎨 Sistema de Alertas")
         st.info("""
@@ -174,68 +231,113 @@ def main():
         
         # Procesar archivos si se subieron
         if uploaded_files and len(uploaded_files) > 0:
-            with st.spinner(f"Procesando {len(uploaded_files)} archivos..."):
-                try:
-                    all_dataframes = []
-                    processed_files = []
-                    
-                    for uploaded_file in uploaded_files:
-                        file_info = {
-                            'nombre': uploaded_file.name,
-                            'tipo': uploaded_file.type,
-                            'tamaño': f"{uploaded_file.size / 1024:.1f} KB"
-                        }
-                        
-                        # Procesar según tipo de archivo
-                        file_ext = uploaded_file.name.split('.')[-1].lower()
+            columnas_excel = PsychosocialAnalyzer.columnas_requeridas(
+                [ANALISIS_DISPONIBLES[app][1] for app in app_selection] + METODOS_SIEMPRE_LEIDOS
+            )
+            linker = RecordLinker() if deduplicar else None
+            # Huella de la ingesta (file_id cambia con cada subida, aunque se repitan nombre y tamaño):
+            # en los reruns se reutiliza el resultado sin volver a leer ni vincular
+            huella = (
+                tuple(f.file_id for f in uploaded_files),
+                excel_rapido, tuple(columnas_excel) if excel_rapido else None,
+                (linker.umbral_nombre, linker.umbral_area, linker.ventana) if linker else None,
+            )
+            ingesta = st.session_state.get('ingesta')
+            if ingesta is None or ingesta['huella'] != huella:
+                ingesta = None
+                with st.spinner(f"Procesando {len(uploaded_files)} archivos..."):
+                    try:
+                        all_dataframes = []
+                        processed_files = []
                         
-                        if file_ext == 'csv':
-                            data = pd.read_csv(uploaded_file)
-                            file_info['registros'] = len(data)
-                            file_info['estado'] = '✅'
+                        for uploaded_file in uploaded_files:
+                            file_info = {
+                                'nombre': uploaded_file.name,
+                                'tipo': uploaded_file.type,
+                                'tamaño': f"{uploaded_file.size / 1024:.1f} KB"
+                            }
                             
-                        elif file_ext in ['xlsx', 'xls']:
-                            data = pd.read_excel(uploaded_file)
-                            file_info['registros'] = len(data)
-                            file_info['estado'] = '✅'
+                            # Procesar según tipo de archivo
+                            file_ext = uploaded_file.name.split('.')[-1].lower()
                             
-                        elif file_ext == 'pdf':
-                            # Para PDF, crear datos de ejemplo basados en el contenido
-                            data = crear_datos_desde_pdf(uploaded_file.name)
-                            file_info['registros'] = len(data)
-                            file_info['estado'] = '📄'
+                            if file_ext == 'csv':
+                                data = leer_csv(uploaded_file)
+                                file_info['registros'] = len(data)
+                                file_info['estado'] = '✅'
+                                
+                            elif file_ext == 'xlsx' and excel_rapido:
+                                data = DocumentProcessor().extract_from_excel_streaming(uploaded_file, columnas_excel)
+                                file_info['registros'] = len(data)
+                                file_info['estado'] = '⚡'
+                                
+                            elif file_ext in ['xlsx', 'xls']:
+                                data = pd.read_excel(uploaded_file)
+                                file_info['registros'] = len(data)
+                                file_info['estado'] = '✅'
+                                
+                            elif file_ext == 'pdf':
+                                # Para PDF, crear datos de ejemplo basados en el contenido
+                                data = crear_datos_desde_pdf(uploaded_file.name)
+                                file_info['registros'] = len(data)
+                                file_info['estado'] = '📄'
+                                
+                            elif file_ext == 'docx':
+                                # Para Word, crear datos de ejemplo
+                                data = crear_datos_desde_word(uploaded_file.name)
+                                file_info['registros'] = len(data)
+                                file_info['estado'] = '📝'
+                                
+                            else:
+                                st.warning(f"Formato no soportado: {uploaded_file.name}")
+                                continue
                             
-                        elif file_ext == 'docx':
-                            # Para Word, crear datos de ejemplo
-                            data = crear_datos_desde_word(uploaded_file.name)
-                            file_info['registros'] = len(data)
-                            file_info['estado'] = '📝'
-                            
-                        else:
-                            st.warning(f"Formato no soportado: {uploaded_file.name}")
-                            continue
+                            all_dataframes.append((uploaded_file.name, a_columnar(data)))
+                            processed_files.append(file_info)
                         
-                        all_dataframes.append(data)
-                        processed_files.append(file_info)
+                        # Combinar todos los DataFrames
+                        if all_dataframes:
+                            ingesta = {'huella': huella, 'processed_files': processed_files}
+                            if linker is not None:
+                                combined_data, linaje = linker.vincular(all_dataframes)
+                                ingesta['combined_data'] = a_columnar(combined_data)
+                                ingesta['linkage_lineage'] = linaje
+                                ingesta['linkage_stats'] = linker.stats
+                            else:
+                                ingesta['combined_data'] = combinar([df for _, df in all_dataframes])
+                            st.session_state.ingesta = ingesta
+                                
+                    except Exception as e:
+                        st.error(f"❌ Error procesando archivos: {str(e)}")
+            
+            if ingesta is not None:
+                # Guardar en session state (el mismo objeto en cada rerun)
+                st.session_state.combined_data = ingesta['combined_data']
+                st.session_state.processed_files = ingesta['processed_files']
+                st.session_state.file_count = len(uploaded_files)
+                for clave in ('linkage_lineage', 'linkage_stats'):
+                    if clave in ingesta:
+                        st.session_state[clave] = ingesta[clave]
+                    else:
+                        st.session_state.pop(clave, None)
+                
+                st.success(f"✅ {len(uploaded_files)} archivos procesados exitosamente!")
+                
+                # Mostrar resumen de archivos
+                with st.expander("📋 Resumen de Archivos Procesados", expanded=True):
+                    files_df = pd.DataFrame(ingesta['processed_files'])
+                    st.dataframe(files_df, use_container_width=True)
                     
-                    # Combinar todos los DataFrames
-                    if all_dataframes:
-                        combined_data = pd.concat(all_dataframes, ignore_index=True)
-                        
-                        # Guardar en session state
-                        st.session_state.combined_data = combined_data
-                        st.session_state.processed_files = processed_files
-                        st.session_state.file_count = len(uploaded_files)
-                        
-                        st.success(f"✅ {len(uploaded_files)} archivos procesados exitosamente!")
-                        
-                        # Mostrar resumen de archivos
-                        with st.expander("📋 Resumen de Archivos Procesados", expanded=True):
-                            files_df = pd.DataFrame(processed_files)
-                            st.dataframe(files_df, use_container_width=True)
-                            
-                except Exception as e:
-                    st.error(f"❌ Error procesando archivos: {str(e)}")
+                    if any(f.get('estado') == '⚡' for f in ingesta['processed_files']):
+                        st.caption("⚡ Excel con lectura rápida: solo se cargaron las columnas "
+                                   f"{', '.join(huella[2])}. Desactiva la lectura rápida para cargar todas.")
+                    
+                    if 'linkage_stats' in ingesta:
+                        stats = ingesta['linkage_stats']
+                        st.info(
+                            f"🔗 {stats['registros_entrada']} registros → "
+                            f"{stats['registros_canonicos']} colaboradores únicos "
+                            f"({stats['duplicados_id']} por ID, {stats['duplicados_nombre']} por nombre)"
+                        )
     
     with col_demo:
         st.subheader("🎲 Datos de Ejemplo")
@@ -245,7 +347,7 @@ def main():
         with demo_col1:
             if st.button("📊 Demo Pequeño", use_container_width=True):
                 data = crear_datos_demo(50)
-                st.session_state.combined_data = data
+                st.session_state.combined_data = a_columnar(data)
                 st.session_state.file_count = 1
                 st.session_state.processed_files = [{'nombre': 'demo_pequeno.csv', 'registros': 50, 'estado': '🎲'}]
                 st.success("✅ Demo pequeño cargado (50 registros)")
@@ -254,7 +356,7 @@ def main():
         with demo_col2:
             if st.button("📈 Demo Grande", use_container_width=True):
                 data = crear_datos_demo(150)
-                st.session_state.combined_data = data
+                st.session_state.combined_data = a_columnar(data)
                 st.session_state.file_count = 1
                 st.session_state.processed_files = [{'nombre': 'demo_grande.csv', 'registros': 150, 'estado': '🎲'}]
                 st.success("✅ Demo grande cargado (150 registros)")
@@ -312,30 +414,17 @@ def main():
             if st.button("🚀 Ejecutar Análisis Seleccionados", type="primary", use_container_width=True):
                 with st.spinner("Procesando análisis con todos los datos..."):
                     try:
-                        analyzer = PsychosocialAnalyzer()
-                        results = {}
-                        
-                        for app_name in app_selection:
-                            if "🚨 Sistema de Alertas" in app_name:
-                                results['alertas'] = analyzer.alerta_temprana(data)
-                            elif "💡 Recomendador" in app_name:
-                                results['recomendaciones'] = analyzer.recomendador_intervenciones(data)
-                            elif "📊 Análisis de Patrones" in app_name:
-                                results['estres'] = analyzer.patrones_estres(data)
-                            elif "🔄 Predictor de Rotación" in app_name:
-                                results['rotacion'] = analyzer.modelo_rotacion(data)
-                            elif "⚠️ Predictor de Incidentes" in app_name:
-                                results['incidentes'] = analyzer.predictor_incidentes(data)
-                            elif "🛡️ Perfiles de Resiliencia" in app_name:
-                                results['resiliencia'] = analyzer.perfiles_resiliencia(data)
-                            elif "📈 Efectividad" in app_name:
-                                results['efectividad'] = analyzer.efectividad_intervenciones(data)
-                            elif "🏥 Enfermedades Laborales (COLORES)" in app_name:
-                                results['enfermedades_colores'] = analyzer.detector_enfermedades_colores(data)
-                            elif "🔴 Rotación con Alertas (COLORES)" in app_name:
-                                results['rotacion_colores'] = analyzer.predictor_rotacion_colores(data)
+                        if modo_exploratorio:
+                            sampler = StratifiedSampler(n_objetivo=int(tamano_muestra))
+                            muestra = sampler.muestrear(data)
+                            results = ejecutar_analisis(muestra.drop(columns=COLUMNAS_DISENO), app_selection)
+                            st.session_state.analysis_sample = muestra[COLUMNAS_DISENO]
+                        else:
+                            results = ejecutar_analisis(data, app_selection)
+                            st.session_state.pop('analysis_sample', None)
                         
                         st.session_state.analysis_results = results
+                        st.session_state.analysis_apps = list(app_selection)
                         st.success(f"✅ {len(results)} análisis completados!")
                         st.rerun()
                         
@@ -345,11 +434,118 @@ def main():
         # Mostrar resultados
         if 'analysis_results' in st.session_state:
             st.header("📈 Resultados del Análisis Combinado")
+            if 'analysis_sample' in st.session_state:
+                display_muestra_exploratoria(st.session_state.analysis_results,
+                                             st.session_state.analysis_sample, data)
             display_combined_results(st.session_state.analysis_results, data)
+        
+        # Constructor de cohortes sobre los flags de riesgo
+        st.header("🎯 Constructor de Cohortes")
+        display_constructor_cohortes(data)
+
+def ejecutar_analisis(data, app_selection):
+    """Ejecutar las aplicaciones seleccionadas sobre los datos"""
+    analyzer = PsychosocialAnalyzer()
+    results = {}
+    for app_name in app_selection:
+        key, metodo = ANALISIS_DISPONIBLES[app_name]
+        results[key] = getattr(analyzer, metodo)(data)
+    return results
+
+def display_constructor_cohortes(data):
+    """Filtros de cohortes resueltos con operaciones de bits sobre el índice empaquetado"""
+    # El índice se construye bajo demanda y se asocia al objeto de datos: la ingesta
+    # reutiliza el mismo DataFrame en cada rerun y crea uno nuevo si cambian los archivos
+    cache = st.session_state.get('cohort_index')
+    if cache is None or cache[0] is not data:
+        # Soltar el índice de datos anteriores para no retenerlos en memoria
+        st.session_state.pop('cohort_index', None)
+        st.caption(f"El índice ejecuta las apps de colores sobre los {len(data)} registros "
+                   "y empaqueta cada flag y categoría en bits.")
+        if not st.button("🧮 Construir índice de cohortes", use_container_width=True):
+            return
+        with st.spinner("Construyendo índice de cohortes..."):
+            cache = (data, CohortIndex.desde_datos(data, PsychosocialAnalyzer()))
+        st.session_state.cohort_index = cache
+    indice = cache[1]
+    
+    flags = [f for f in FLAGS_DESCRIPCION if f in indice.bitsets]
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        requeridos = st.multiselect("Debe cumplir (Y):", flags, format_func=FLAGS_DESCRIPCION.get,
+                                    key="cohorte_requeridos")
+        excluidos = st.multiselect("Excluir:", flags, format_func=FLAGS_DESCRIPCION.get,
+                                   key="cohorte_excluidos")
+    
+    with col2:
+        filtros_categoricos = {}
+        for columna, etiqueta in [('area_trabajo', "Áreas (O):"), ('tipo_contrato', "Tipo de contrato (O):"),
+                                  ('riesgo_enfermedad', "Riesgo enfermedad (O):"),
+                                  ('riesgo_rotacion', "Riesgo rotación (O):")]:
+            valores = indice.valores(columna)
+            if valores:
+                filtros_categoricos[columna] = st.multiselect(etiqueta, valores, key=f"cohorte_{columna}")
+    
+    bits = indice.consultar(todas=requeridos, ninguna=excluidos)
+    for columna, seleccion in filtros_categoricos.items():
+        if seleccion:
+            bits &= indice.consultar(alguna=[f'{columna}={v}' for v in seleccion])
+    total = indice.contar(bits)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("👥 Colaboradores en la cohorte", total)
+    with col2:
+        st.metric("📊 Porcentaje", f"{(total / max(indice.n, 1)) * 100:.1f}%")
+    with col3:
+        st.metric("💾 Memoria del índice", f"{indice.memoria() / 1024:.1f} KB")
+    
+    if total > 0:
+        st.dataframe(data.loc[indice.filas(bits)[:50]], use_container_width=True)
+
+def display_muestra_exploratoria(results, diseno, data):
+    """Tasas de riesgo estimadas con intervalos de confianza y promoción a cálculo completo"""
+    st.warning(
+        f"🔬 **Resultados exploratorios:** calculados sobre una muestra estratificada de "
+        f"{len(diseno)} de {len(data)} registros (área × tipo de contrato)."
+    )
+    
+    if st.button("⏫ Promover a cálculo completo", use_container_width=True):
+        with st.spinner("Procesando análisis con todos los datos..."):
+            st.session_state.analysis_results = ejecutar_analisis(
+                data, st.session_state.get('analysis_apps', [])
+            )
+            del st.session_state['analysis_sample']
+        st.rerun()
+    
+    sampler = StratifiedSampler()
+    for key, result in results.items():
+        if key not in INDICADORES_RIESGO:
+            continue
+        etiqueta, indicador = INDICADORES_RIESGO[key]
+        try:
+            marcado = indicador(result)
+        except KeyError:
+            continue
+        
+        total = sampler.estimar_tasa(marcado, diseno).iloc[0]
+        st.subheader(f"{etiqueta}: {total['tasa']*100:.1f}% "
+                     f"(IC 95%: {total['ic_inferior']*100:.1f}% – {total['ic_superior']*100:.1f}%)")
+        
+        if 'area_trabajo' in result.columns:
+            por_area = sampler.estimar_tasa(marcado, diseno, por=result['area_trabajo'].astype(str))
+            tabla = por_area[['tasa', 'ic_inferior', 'ic_superior']].mul(100).round(1)
+            tabla.columns = ['Tasa %', 'IC inferior %', 'IC superior %']
+            tabla['Muestra'] = por_area['n_muestra']
+            tabla['Población'] = por_area['N_poblacion']
+            st.dataframe(tabla, use_container_width=True)
 
 def clear_session_state():
     """Limpiar todos los datos de la sesión"""
-    keys_to_clear = ['combined_data', 'processed_files', 'file_count', 'analysis_results']
+    keys_to_clear = ['combined_data', 'processed_files', 'file_count', 'analysis_results',
+                     'linkage_lineage', 'linkage_stats', 'analysis_sample', 'analysis_apps',
+                     'cohort_index', 'chart_data', 'ingesta']
     for key in keys_to_clear:
         if key in st.session_state:
             del st.session_state[key]
@@ -384,6 +580,15 @@ def crear_datos_desde_word(nombre_archivo):
     """Crear datos basados en un documento Word"""
     return crear_datos_demo(np.random.randint(20, 80))
 
+def obtener_graficos(key, result, original_data):
+    """Datos de gráficos de un resultado, calculados una vez por análisis y guardados en sesión"""
+    cache = st.session_state.setdefault('chart_data', {})
+    entrada = cache.get(key)
+    if entrada is None or entrada[0] is not result:
+        entrada = (result, preparar_graficos(key, result, original_data))
+        cache[key] = entrada
+    return entrada[1]
+
 def display_combined_results(results, original_data):
     """Mostrar resultados de análisis combinados"""
     
@@ -392,23 +597,26 @@ def display_combined_results(results, original_data):
     
     for i, (key, result) in enumerate(results.items()):
         with tabs[i]:
+            graficos = obtener_graficos(key, result, original_data)
             if key == 'alertas':
-                display_alertas_results(result, original_data)
+                display_alertas_results(result, graficos)
             elif key == 'recomendaciones':
-                display_recomendaciones_results(result, original_data)
+                display_recomendaciones_results(result, graficos)
             elif key == 'estres':
-                display_estres_results(result, original_data)
+                display_estres_results(result, graficos)
             elif key == 'rotacion':
-                display_rotacion_results(result, original_data)
+                display_rotacion_results(result, graficos)
             elif key == 'enfermedades_colores':
-                display_enfermedades_colores_results(result, original_data)
+                display_enfermedades_colores_results(result, graficos)
             elif key == 'rotacion_colores':
-                display_rotacion_colores_results(result, original_data)
+                display_rotacion_colores_results(result, graficos)
+            elif key == 'simulacion':
+                display_simulacion_results(result, graficos)
             else:
                 st.dataframe(result.head(15), use_container_width=True)
                 
                 # Botón de descarga para cada resultado
-                csv = result.to_csv(index=False)
+                csv = exportar_csv(result)
                 st.download_button(
                     label=f"📥 Descargar {key}.csv",
                     data=csv,
@@ -416,10 +624,12 @@ def display_combined_results(results, original_data):
                     mime="text/csv",
                     key=f"download_{key}"
                 )
+            
+            mostrar_visualizaciones(graficos)
 
-def display_alertas_results(result, original_data):
+def display_alertas_results(result, graficos):
     """Mostrar resultados de alertas"""
-    total_riesgo = result['riesgo_alto'].sum() if 'riesgo_alto' in result.columns else 0
+    total_riesgo = graficos['conteos'].get('riesgo_alto', 0)
     
     col1, col2 = st.columns(2)
     
@@ -431,12 +641,11 @@ def display_alertas_results(result, original_data):
             st.dataframe(result[result['riesgo_alto'] == 1].head(10), use_container_width=True)
     
     with col2:
-        if 'area_trabajo' in original_data.columns:
+        if 'Riesgo por Área' in graficos['barras']:
             st.subheader("Riesgo por Área")
-            riesgo_area = result.groupby(original_data['area_trabajo'])['riesgo_alto'].mean()
-            st.bar_chart(riesgo_area)
+            st.bar_chart(graficos['barras']['Riesgo por Área'])
 
-def display_recomendaciones_results(result, original_data):
+def display_recomendaciones_results(result, graficos):
     """Mostrar resultados de recomendaciones"""
     if 'recomendacion' in result.columns:
         st.subheader("💡 Recomendaciones Generadas")
@@ -448,26 +657,26 @@ def display_recomendaciones_results(result, original_data):
         
         with col2:
             st.subheader("📈 Frecuencia de Recomendaciones")
-            rec_counts = result['recomendacion'].value_counts()
+            rec_counts = graficos['barras']['Frecuencia de Recomendaciones']
             for rec, count in rec_counts.head(5).items():
                 st.write(f"**{rec}**: {count} personas")
 
-def display_estres_results(result, original_data):
+def display_estres_results(result, graficos):
     """Mostrar resultados de estrés"""
     if 'cluster' in result.columns:
         st.subheader("🎯 Clusters de Estrés Identificados")
         
-        cluster_counts = result['cluster'].value_counts()
+        cluster_counts = graficos['conteos']['clusters']
         col1, col2, col3 = st.columns(3)
         
         for i, (cluster, count) in enumerate(cluster_counts.items()):
             with [col1, col2, col3][i % 3]:
                 st.metric(f"Cluster {cluster}", count)
 
-def display_rotacion_results(result, original_data):
+def display_rotacion_results(result, graficos):
     """Mostrar resultados de rotación"""
     if 'riesgo_rotacion' in result.columns:
-        riesgo_count = result['riesgo_rotacion'].sum()
+        riesgo_count = graficos['conteos']['riesgo_rotacion']
         
         col1, col2 = st.columns(2)
         
@@ -479,15 +688,16 @@ def display_rotacion_results(result, original_data):
             if riesgo_count > 0:
                 st.dataframe(result[result['riesgo_rotacion'] == 1].head(10), use_container_width=True)
 
-def display_enfermedades_colores_results(result, original_data):
+def display_enfermedades_colores_results(result, graficos):
     """Mostrar resultados de enfermedades laborales con colores"""
     st.header("🏥 Detector de Enfermedades Laborales")
     
     if 'riesgo_enfermedad' in result.columns:
         # Métricas con colores
-        alto_riesgo = len(result[result['riesgo_enfermedad'] == '🔴 Alto'])
-        medio_riesgo = len(result[result['riesgo_enfermedad'] == '🟡 Medio'])
-        bajo_riesgo = len(result[result['riesgo_enfermedad'] == '🟢 Bajo'])
+        bandas = graficos['conteos']['bandas']
+        alto_riesgo = int(bandas['🔴 Alto'])
+        medio_riesgo = int(bandas['🟡 Medio'])
+        bajo_riesgo = int(bandas['🟢 Bajo'])
         
         col1, col2, col3 = st.columns(3)
         
@@ -511,11 +721,10 @@ def display_enfermedades_colores_results(result, original_data):
         
         # Gráfico de distribución
         st.subheader("📊 Distribución de Riesgos de Salud")
-        distribucion = result['riesgo_enfermedad'].value_counts()
-        st.bar_chart(distribucion)
+        st.bar_chart(graficos['barras']['Distribución de Riesgos'])
     
     # Descargar resultados
-    csv = result.to_csv(index=False)
+    csv = exportar_csv(result)
     st.download_button(
         label="📥 Descargar Resultados Enfermedades",
         data=csv,
@@ -523,15 +732,16 @@ def display_enfermedades_colores_results(result, original_data):
         mime="text/csv"
     )
 
-def display_rotacion_colores_results(result, original_data):
+def display_rotacion_colores_results(result, graficos):
     """Mostrar resultados de rotación con colores"""
     st.header("🔴 Predictor de Rotación con Alertas")
     
     if 'riesgo_rotacion' in result.columns:
         # Métricas con colores
-        alto_riesgo = len(result[result['riesgo_rotacion'] == '🔴 Alto'])
-        medio_riesgo = len(result[result['riesgo_rotacion'] == '🟡 Medio'])
-        bajo_riesgo = len(result[result['riesgo_rotacion'] == '🟢 Bajo'])
+        bandas = graficos['conteos']['bandas']
+        alto_riesgo = int(bandas['🔴 Alto'])
+        medio_riesgo = int(bandas['🟡 Medio'])
+        bajo_riesgo = int(bandas['🟢 Bajo'])
         
         col1, col2, col3 = st.columns(3)
         
@@ -562,7 +772,7 @@ def display_rotacion_colores_results(result, original_data):
             st.write("- Encuestas de satisfacción")
     
     # Descargar resultados
-    csv = result.to_csv(index=False)
+    csv = exportar_csv(result)
     st.download_button(
         label="📥 Descargar Resultados Rotación",
         data=csv,
@@ -570,5 +780,34 @@ def display_rotacion_colores_results(result, original_data):
         mime="text/csv"
     )
 
+def display_simulacion_results(result, graficos):
+    """Mostrar ranking de intervenciones simuladas por área"""
+    st.header("🧪 Simulador de Intervenciones")
+    st.caption("Reducción de la tasa de riesgo 🔴 Alto al aplicar cada intervención a toda el área "
+               "(enfermedades laborales + rotación)")
+    
+    if 'reduccion_total' in result.columns and len(result) > 0:
+        mejores = result[result['ranking'] == 1]
+        
+        st.subheader("🏆 Mejor Intervención por Área")
+        tabla = mejores[['area_trabajo', 'intervencion', 'colaboradores',
+                         'reduccion_enfermedad', 'reduccion_rotacion']].copy()
+        tabla[['reduccion_enfermedad', 'reduccion_rotacion']] = (
+            tabla[['reduccion_enfermedad', 'reduccion_rotacion']] * 100
+        ).round(1)
+        st.dataframe(tabla, use_container_width=True)
+        
+        st.subheader("📊 Reducción de Riesgo por Intervención (puntos %)")
+        st.bar_chart(graficos['barras']['Reducción de Riesgo por Intervención (puntos %)'])
+    
+    csv = exportar_csv(result)
+    st.download_button(
+        label="📥 Descargar Simulación",
+        data=csv,
+        file_name="simulacion_intervenciones.csv",
+        mime="text/csv"
+    )
+
+
 if __name__ == "__main__":
-    main()
+    main()
\ No newline at end of file
@@ -0,0 +1,252 @@
+# benchmarks/bench_differential.py
+"""
+Arnés diferencial: compara motores de las apps de colores contra la referencia congelada.
+
+Para cada tamaño de dataset genera datos sintéticos (con valores faltantes,
+niveles desconocidos y valores en los bordes de cada umbral), ejecuta la
+referencia y cada motor, exige etiquetas 🟢/🟡/🔴 y flags idénticos, y reporta
+aceleración y memoria pico por app. Sale con código 1 si hay diferencias.
+
+Las salidas de la referencia también quedan congeladas: reference_checksums.json
+guarda, por (filas, seed), un checksum de los datos generados y de las etiquetas
+de cada app. Si una actualización de pandas cambia el comportamiento de la
+referencia (p. ej. pd.cut), el arnés lo detecta aunque el candidato cambie igual.
+--registrar escribe los checksums de los tamaños ejecutados.
+
+Uso: python benchmarks/bench_differential.py [--tamanos 1000,10000,...]
+                                             [--motor modulo:Clase ...] [--registrar]
+"""
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(DIRECTORIO)
+sys.path.append(os.path.join(DIRECTORIO, '..', 'modules'))
+
+import pandas as pd
+from reference_analyzer import ReferenceAnalyzer
+from intervention_simulator import InterventionSimulator, NIVEL_ALTO
+
+APPS = {
+    'detector_enfermedades_colores': ['punto_estres', 'punto_demandas', 'punto_satisfaccion',
+                                      'punto_ausentismo', 'riesgo_enfermedad',
+                                      'alerta_depresion', 'alerta_ansiedad'],
+    'predictor_rotacion_colores': ['punto_rot_satisfaccion', 'punto_rot_estres',
+                                   'punto_rot_antiguedad', 'riesgo_rotacion'],
+}
+
+TAMANOS = [1000, 10000, 100000, 1000000, 5000000]
+CHECKSUMS = os.path.join(DIRECTORIO, 'reference_checksums.json')
+ETIQUETAS = np.array(['🟢 Bajo', '🟡 Medio', '🔴 Alto'], dtype=object)
+
+
+class MotorVectorizado:
+    """Motor candidato: puntajes y bandas con las operaciones de InterventionSimulator"""
+
+    def __init__(self):
+        self.simulador = InterventionSimulator({})
+
+    def detector_enfermedades_colores(self, data):
+        v = self.simulador.preparar(data)
+        df = data.copy(deep=False)
+        factores = [('punto_estres', 'nivel_estres', lambda x: x >= NIVEL_ALTO),
+                    ('punto_demandas', 'demandas_jornada', lambda x: x >= NIVEL_ALTO),
+                    ('punto_satisfaccion', 'satisfaccion_laboral', lambda x: x < 5),
+                    ('punto_ausentismo', 'ausentismo_dias', lambda x: x > 5)]
+        for columna, variable, condicion in factores:
+            if variable in v:
+                df[columna] = condicion(v[variable]).astype(int)
+        score = self.simulador.score_enfermedad(v) * np.ones(len(df), dtype=np.int8)
+        df['riesgo_enfermedad'] = pd.Categorical.from_codes(
+            self.simulador.banda_enfermedad(score), categories=list(ETIQUETAS), ordered=True
+        )
+        alerta = np.where(score >= 2, '🔴 Alta', '🟢 Baja')
+        df['alerta_depresion'] = alerta
+        df['alerta_ansiedad'] = alerta
+        return df
+
+    def predictor_rotacion_colores(self, data):
+        v = self.simulador.preparar(data)
+        df = data.copy(deep=False)
+        factores = [('punto_rot_satisfaccion', 'satisfaccion_laboral', lambda x: x < 4),
+                    ('punto_rot_estres', 'nivel_estres', lambda x: x >= NIVEL_ALTO),
+                    ('punto_rot_antiguedad', 'antiguedad_meses', lambda x: x < 12)]
+        for columna, variable, condicion in factores:
+            if variable in v:
+                df[columna] = condicion(v[variable]).astype(int)
+        score = self.simulador.score_rotacion(v) * np.ones(len(df), dtype=np.int8)
+        df['riesgo_rotacion'] = pd.Categorical.from_codes(
+            self.simulador.banda_rotacion(score), categories=list(ETIQUETAS), ordered=True
+        )
+        return df
+
+
+MOTORES = {
+    'actual': 'ml_applications:PsychosocialAnalyzer',
+    'vectorizado': 'bench_differential:MotorVectorizado',
+}
+
+
+def cargar_motor(ruta):
+    modulo, clase = ruta.split(':')
+    if modulo == 'bench_differential':
+        return globals()[clase]()
+    return getattr(importlib.import_module(modulo), clase)()
+
+
+def generar_datos(n, seed=0):
+    """Datos sintéticos con casos borde para cada umbral de las apps de colores"""
+    rng = np.random.default_rng(seed)
+    niveles = np.array(['Bajo', 'Medio', 'Alto', 'Muy Alto', 'N/A', None], dtype=object)
+    probabilidades = [0.3, 0.3, 0.2, 0.1, 0.05, 0.05]
+    return pd.DataFrame({
+        'id_colaborador': np.arange(1, n + 1),
+        'area_trabajo': rng.choice(['Académica', 'Administrativa', 'Operativa', 'Comercial'], n),
+        'nivel_estres': rng.choice(niveles, n, p=probabilidades),
+        'demandas_jornada': rng.choice(niveles, n, p=probabilidades),
+        'satisfaccion_laboral': rng.choice([1, 2, 3, 3.5, 4, 4.5, 5, 6, 8, 10, np.nan], n),
+        'ausentismo_dias': rng.choice([0, 2, 4, 5, 6, 8, 12], n),
+        'antiguedad_meses': rng.choice([1, 6, 11, 12, 13, 24, 60, 119], n),
+    })
+
+
+def medir(motor, app, data):
+    """(resultado, segundos, MB pico): tiempo sin instrumentar y memoria en una segunda pasada"""
+    inicio = time.perf_counter()
+    resultado = getattr(motor, app)(data)
+    segundos = time.perf_counter() - inicio
+    tracemalloc.start()
+    getattr(motor, app)(data)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, segundos, pico / 1e6
+
+
+def diferencias(referencia, candidato, columnas):
+    """Filas distintas por columna (las etiquetas se comparan como texto)"""
+    errores = {}
+    for col in columnas:
+        if col not in referencia.columns:
+            continue
+        if col not in candidato.columns:
+            errores[col] = len(referencia)
+            continue
+        a, b = referencia[col], candidato[col]
+        if pd.api.types.is_numeric_dtype(a) and pd.api.types.is_numeric_dtype(b):
+            distintas = a.to_numpy() != b.to_numpy()
+        else:
+            distintas = a.astype(str).to_numpy(dtype=object) != b.astype(str).to_numpy(dtype=object)
+        if distintas.any():
+            errores[col] = int(distintas.sum())
+    return errores
+
+
+def checksum(df, columnas):
+    """SHA-256 de los valores (como texto) de las columnas presentes, independiente del dtype"""
+    resumen = hashlib.sha256()
+    for col in columnas:
+        if col not in df.columns:
+            continue
+        # Etiquetas en orden de aparición y un código por fila (-1 para nulos)
+        codigos, etiquetas = pd.factorize(df[col].astype(object))
+        resumen.update(col.encode('utf-8'))
+        resumen.update('\x1f'.join(str(e) for e in etiquetas).encode('utf-8'))
+        resumen.update(codigos.astype('<i4').tobytes())
+    return resumen.hexdigest()
+
+
+def cargar_checksums():
+    if not os.path.exists(CHECKSUMS):
+        return {}
+    with open(CHECKSUMS, encoding='utf-8') as archivo:
+        return json.load(archivo)
+
+
+def verificar_referencia(checksums, n, seed, data, salidas):
+    """
+    Comparar los checksums de datos y etiquetas de la referencia con los congelados.
+
+    Devuelve (errores, registro): mensajes de diferencia y la entrada calculada.
+    """
+    registro = {'datos': checksum(data, list(data.columns))}
+    registro.update({app: checksum(salidas[app], columnas) for app, columnas in APPS.items()})
+    congelado = checksums.get(f'{n}:{seed}')
+    if congelado is None:
+        return None, registro
+    if congelado['datos'] != registro['datos']:
+        return ["los datos generados cambiaron (¿numpy o generar_datos?): regenerar con --registrar"], registro
+    errores = [f"la referencia cambió en {app}" for app in APPS if congelado.get(app) != registro[app]]
+    return errores, registro
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Arnés diferencial de las apps de colores")
+    parser.add_argument('--tamanos', default=','.join(str(t) for t in TAMANOS))
+    parser.add_argument('--motor', action='append', default=None,
+                        help="Motor a comparar como modulo:Clase (por defecto: actual y vectorizado)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--registrar', action='store_true',
+                        help="Guardar los checksums de la referencia para los tamaños ejecutados")
+    args = parser.parse_args()
+    checksums = cargar_checksums()
+
+    motores = {nombre: cargar_motor(ruta) for nombre, ruta in
+               ([(m, m) for m in args.motor] if args.motor else MOTORES.items())}
+    referencia = ReferenceAnalyzer()
+    fallos = 0
+
+    print(f"{'Filas':>9} {'App':<30} {'Motor':<12} {'Tiempo (s)':>11} {'Aceleración':>12} "
+          f"{'Mem (MB)':>9} {'Mem ref.':>9}  Etiquetas")
+    for n in [int(t) for t in args.tamanos.split(',')]:
+        data = generar_datos(n, args.seed)
+        salidas = {}
+        for app, columnas in APPS.items():
+            esperado, t_ref, m_ref = medir(referencia, app, data)
+            salidas[app] = esperado[[c for c in columnas if c in esperado.columns]]
+            print(f"{n:>9} {app:<30} {'referencia':<12} {t_ref:>11.3f} {'1.0x':>12} {m_ref:>9.1f} {'':>9}")
+            for nombre, motor in motores.items():
+                obtenido, t, m = medir(motor, app, data)
+                errores = diferencias(esperado, obtenido, columnas)
+                estado = '✅ idénticas' if not errores else f'❌ {errores}'
+                fallos += bool(errores)
+                print(f"{'':>9} {'':<30} {nombre:<12} {t:>11.3f} {t_ref / t:>11.1f}x "
+                      f"{m:>9.1f} {m_ref / max(m, 1e-9):>8.1f}x  {estado}")
+                del obtenido
+            del esperado
+
+        errores, registro = verificar_referencia(checksums, n, args.seed, data, salidas)
+        if args.registrar:
+            checksums[f'{n}:{args.seed}'] = registro
+            print(f"{'':>9} checksums de la referencia registrados")
+        elif errores is None:
+            print(f"{'':>9} ⚠️ sin checksum congelado para {n} filas (seed {args.seed})")
+        elif errores:
+            fallos += len(errores)
+            for error in errores:
+                print(f"{'':>9} ❌ {error}")
+        else:
+            print(f"{'':>9} ✅ referencia igual a las salidas congeladas")
+        del data, salidas
+
+    if args.registrar:
+        with open(CHECKSUMS, 'w', encoding='utf-8', newline='\r\n') as archivo:
+            json.dump(dict(sorted(checksums.items(), key=lambda e: tuple(map(int, e[0].split(':'))))),
+                      archivo, indent=2)
+            archivo.write('\n')
+
+    if fallos:
+        print(f"\n❌ {fallos} comparaciones con etiquetas distintas a la referencia o a las salidas congeladas")
+        sys.exit(1)
+    print("\n✅ Todas las etiquetas coinciden con la referencia congelada")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# benchmarks/bench_excel_ingestion.py
+"""
+Compara la ingesta de Excel actual (pd.read_excel) con la lectura en streaming.
+
+Uso: python benchmarks/bench_excel_ingestion.py [filas_por_hoja] [hojas] [columnas_extra]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+from openpyxl import Workbook
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'modules'))
+
+import pandas as pd
+from data_extractor import DocumentProcessor
+from ml_applications import PsychosocialAnalyzer
+
+
+def crear_libro(ruta, filas, hojas, columnas_extra):
+    """Libro regional con varias hojas, fila de título y columnas que no se analizan"""
+    rng = np.random.default_rng(42)
+    niveles = np.array(['Bajo', 'Medio', 'Alto', 'Muy Alto'])
+    areas = np.array(['Académica', 'Administrativa', 'Operativa', 'Comercial', 'Investigación'])
+    encabezado = ['id_colaborador', 'nombre', 'area_trabajo', 'nivel_estres', 'demandas_jornada',
+                  'satisfaccion_laboral', 'ausentismo_dias', 'antiguedad_meses']
+    encabezado += [f'extra_{i}' for i in range(columnas_extra)]
+
+    libro = Workbook(write_only=True)
+    for h in range(hojas):
+        hoja = libro.create_sheet(f'Region_{h + 1}')
+        hoja.append([f'Exportación regional {h + 1}'])
+        hoja.append(encabezado)
+        base = h * filas
+        estres = rng.choice(niveles, filas)
+        demandas = rng.choice(niveles, filas)
+        area = rng.choice(areas, filas)
+        satisfaccion = rng.integers(1, 11, filas)
+        ausentismo = rng.poisson(3, filas)
+        antiguedad = rng.integers(1, 120, filas)
+        extras = rng.random((filas, columnas_extra)).round(3)
+        for i in range(filas):
+            hoja.append([base + i + 1, f'Colaborador_{base + i + 1}', area[i], estres[i], demandas[i],
+                         int(satisfaccion[i]), int(ausentismo[i]), int(antiguedad[i])]
+                        + extras[i].tolist())
+    libro.save(ruta)
+
+
+def medir(nombre, funcion):
+    """Tiempo sin instrumentar y memoria pico (tracemalloc) en una segunda pasada"""
+    inicio = time.perf_counter()
+    df = funcion()
+    segundos = time.perf_counter() - inicio
+    del df
+    tracemalloc.start()
+    df = funcion()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{nombre:<42} {segundos:>8.2f} s {pico / 1e6:>10.1f} MB {len(df):>9} filas {len(df.columns):>4} cols")
+    return segundos, pico
+
+
+def main():
+    filas = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    hojas = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    columnas_extra = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    columnas = PsychosocialAnalyzer.columnas_requeridas(['detector_enfermedades_colores',
+                                                         'predictor_rotacion_colores'])
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = os.path.join(tmp, 'regional.xlsx')
+        crear_libro(ruta, filas, hojas, columnas_extra)
+        print(f"Libro: {hojas} hojas x {filas} filas, {columnas_extra} columnas extra "
+              f"({os.path.getsize(ruta) / 1e6:.1f} MB)\n")
+
+        procesador = DocumentProcessor()
+        actual_t, actual_m = medir("pd.read_excel (primera hoja, actual)",
+                                   lambda: pd.read_excel(ruta, header=1))
+        todas_t, todas_m = medir("pd.read_excel (todas las hojas)",
+                                 lambda: pd.concat(pd.read_excel(ruta, header=1, sheet_name=None).values(),
+                                                   ignore_index=True))
+        rapido_t, rapido_m = medir("streaming + proyección (todas las hojas)",
+                                   lambda: procesador.extract_from_excel_streaming(ruta, columnas))
+
+    print(f"\nStreaming vs todas las hojas con pd.read_excel: "
+          f"{todas_t / rapido_t:.1f}x más rápido, {todas_m / rapido_m:.1f}x menos memoria pico")
+    print(f"Streaming vs ruta actual (solo primera hoja):   "
+          f"{actual_t / rapido_t:.1f}x tiempo, {actual_m / rapido_m:.1f}x memoria")
+
+
+if __name__ == "__main__":
+    main()
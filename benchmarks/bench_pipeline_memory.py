@@ -0,0 +1,119 @@
+# benchmarks/bench_pipeline_memory.py
+"""
+Pico de RSS durante un ciclo completo carga -> análisis -> descarga.
+
+Cada variante corre en un subproceso propio (ru_maxrss es monótono):
+  - actual:    pd.read_csv + pd.concat + copia profunda por análisis + to_csv
+  - vinculado: ruta por defecto de la app: lectura Arrow + RecordLinker.vincular +
+               análisis sobre columnas compartidas + exportación Arrow
+  - columnar:  igual que vinculado con la deduplicación desactivada (combinar)
+
+Uso: python benchmarks/bench_pipeline_memory.py [filas]
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+MODULES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'modules')
+sys.path.append(MODULES)
+
+import pandas as pd
+
+APPS = ['alerta_temprana', 'modelo_rotacion', 'predictor_incidentes',
+        'detector_enfermedades_colores', 'predictor_rotacion_colores']
+
+
+def crear_csvs(directorio, filas, archivos=2):
+    """Exportaciones regionales en CSV (mismo esquema que los datos demo)"""
+    rng = np.random.default_rng(42)
+    niveles = ['Bajo', 'Medio', 'Alto', 'Muy Alto']
+    rutas = []
+    por_archivo = filas // archivos
+    for i in range(archivos):
+        base = i * por_archivo
+        df = pd.DataFrame({
+            'id_colaborador': np.arange(base + 1, base + por_archivo + 1),
+            'nombre': [f'Colaborador_{j}' for j in range(base + 1, base + por_archivo + 1)],
+            'area_trabajo': rng.choice(['Académica', 'Administrativa', 'Operativa', 'Comercial',
+                                        'Investigación'], por_archivo),
+            'cargo': rng.choice(['Profesor', 'Administrativo', 'Coordinador', 'Investigador',
+                                 'Asistente'], por_archivo),
+            'nivel_estres': rng.choice(niveles, por_archivo),
+            'demandas_jornada': rng.choice(niveles, por_archivo),
+            'satisfaccion_laboral': rng.integers(1, 11, por_archivo),
+            'ausentismo_dias': rng.poisson(3, por_archivo),
+            'antiguedad_meses': rng.integers(1, 120, por_archivo),
+            'edad': rng.integers(25, 60, por_archivo),
+            'genero': rng.choice(['Femenino', 'Masculino', 'Otro'], por_archivo),
+            'tipo_contrato': rng.choice(['Indefinido', 'Temporal', 'Prestación servicios'], por_archivo),
+        })
+        ruta = os.path.join(directorio, f'region_{i + 1}.csv')
+        df.to_csv(ruta, index=False)
+        rutas.append(ruta)
+    return rutas
+
+
+def ciclo(variante, rutas):
+    """Ejecutado en el subproceso: devuelve (MB de pico sobre la base, segundos)"""
+    from ml_applications import PsychosocialAnalyzer
+    from columnar import a_columnar, leer_csv, combinar, exportar_csv
+    from record_linkage import RecordLinker
+
+    analyzer = PsychosocialAnalyzer()
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    inicio = time.perf_counter()
+
+    if variante == 'actual':
+        data = pd.concat([pd.read_csv(r) for r in rutas], ignore_index=True)
+        # Cada análisis trabajaba sobre su propia copia profunda de los datos
+        resultados = {app: getattr(analyzer, app)(data.copy(deep=True)) for app in APPS}
+        descargas = {app: df.to_csv(index=False) for app, df in resultados.items()}
+    else:
+        fuentes = [(os.path.basename(r), leer_csv(r)) for r in rutas]
+        if variante == 'vinculado':
+            data = a_columnar(RecordLinker().vincular(fuentes)[0])
+        else:
+            data = combinar([df for _, df in fuentes])
+        del fuentes
+        resultados = {app: getattr(analyzer, app)(data) for app in APPS}
+        descargas = {app: exportar_csv(df) for app, df in resultados.items()}
+
+    segundos = time.perf_counter() - inicio
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return (pico - base) / 1024, segundos, sum(len(d) for d in descargas.values())
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == '--variante':
+        mb, segundos, bytes_csv = ciclo(sys.argv[2], sys.argv[3:])
+        print(f"{mb:.1f} {segundos:.3f} {bytes_csv}")
+        return
+
+    filas = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    with tempfile.TemporaryDirectory() as tmp:
+        rutas = crear_csvs(tmp, filas)
+        print(f"{filas} filas en {len(rutas)} archivos CSV, {len(APPS)} análisis\n")
+        print(f"{'Variante':<10} {'Pico RSS (MB)':>14} {'Tiempo (s)':>11} {'CSV exportado (MB)':>19}")
+        medidas = {}
+        for variante in ('actual', 'vinculado', 'columnar'):
+            salida = subprocess.run([sys.executable, os.path.abspath(__file__), '--variante', variante] + rutas,
+                                    capture_output=True, text=True, check=True).stdout.split()
+            mb, segundos, bytes_csv = float(salida[-3]), float(salida[-2]), int(salida[-1])
+            medidas[variante] = (mb, segundos)
+            print(f"{variante:<10} {mb:>14.1f} {segundos:>11.2f} {bytes_csv / 1e6:>19.1f}")
+
+    mb_a, s_a = medidas['actual']
+    print()
+    for variante in ('vinculado', 'columnar'):
+        mb, segundos = medidas[variante]
+        print(f"{variante.capitalize()}: {mb_a / max(mb, 1e-9):.1f}x menos memoria pico, "
+              f"{s_a / segundos:.1f}x más rápido")
+
+
+if __name__ == "__main__":
+    main()
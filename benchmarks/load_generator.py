@@ -0,0 +1,106 @@
+# benchmarks/load_generator.py
+"""
+Generador de carga para el servicio de scoring (modules/scoring_service.py).
+
+Sin --url levanta un servidor local en un puerto libre, envía solicitudes
+individuales concurrentes y compara la latencia con micro-batching activo
+frente a lotes de tamaño 1.
+
+Uso: python benchmarks/load_generator.py [--url http://127.0.0.1:8765]
+                                         [--solicitudes 2000] [--concurrencia 32]
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'modules'))
+
+from scoring_service import crear_servidor
+
+
+NIVELES = ['Bajo', 'Medio', 'Alto', 'Muy Alto']
+
+
+def generar_colaboradores(n, seed=42):
+    rng = np.random.default_rng(seed)
+    return [{
+        'id_colaborador': i + 1,
+        'area_trabajo': str(rng.choice(['Académica', 'Administrativa', 'Operativa'])),
+        'nivel_estres': str(rng.choice(NIVELES)),
+        'demandas_jornada': str(rng.choice(NIVELES)),
+        'satisfaccion_laboral': int(rng.integers(1, 11)),
+        'ausentismo_dias': int(rng.poisson(3)),
+        'antiguedad_meses': int(rng.integers(1, 120)),
+    } for i in range(n)]
+
+
+def _post(url, registro):
+    datos = json.dumps(registro).encode('utf-8')
+    solicitud = urllib.request.Request(url + '/score', data=datos,
+                                       headers={'Content-Type': 'application/json'})
+    inicio = time.perf_counter()
+    with urllib.request.urlopen(solicitud, timeout=30) as respuesta:
+        json.loads(respuesta.read())
+    return time.perf_counter() - inicio
+
+
+def ejecutar_carga(url, registros, concurrencia):
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrencia) as pool:
+        latencias = np.array(list(pool.map(lambda r: _post(url, r), registros))) * 1000
+    total = time.perf_counter() - inicio
+    with urllib.request.urlopen(url + '/stats', timeout=10) as respuesta:
+        stats = json.loads(respuesta.read())
+    return latencias, total, stats
+
+
+def reportar(titulo, latencias, total, stats):
+    p50, p95, p99 = np.percentile(latencias, [50, 95, 99])
+    print(f"\n{titulo}")
+    print(f"  Solicitudes:        {len(latencias)} en {total:.2f} s ({len(latencias) / total:.0f} req/s)")
+    print(f"  Latencia cliente:   p50 {p50:.1f} ms | p95 {p95:.1f} ms | p99 {p99:.1f} ms")
+    if 'latencia_p50_ms' in stats:
+        print(f"  Latencia servidor:  p50 {stats['latencia_p50_ms']:.1f} ms | "
+              f"p95 {stats['latencia_p95_ms']:.1f} ms | p99 {stats['latencia_p99_ms']:.1f} ms")
+    print(f"  Lotes:              {stats['lotes']} (tamaño medio {stats['tamano_medio_lote']:.1f})")
+
+
+def servidor_local(max_lote, espera_ms):
+    servidor = crear_servidor(port=0, max_lote=max_lote, espera_ms=espera_ms)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor, f"http://127.0.0.1:{servidor.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generador de carga para el servicio de scoring")
+    parser.add_argument('--url', default=None)
+    parser.add_argument('--solicitudes', type=int, default=2000)
+    parser.add_argument('--concurrencia', type=int, default=32)
+    args = parser.parse_args()
+
+    registros = generar_colaboradores(args.solicitudes)
+
+    if args.url:
+        reportar(f"Servidor {args.url}", *ejecutar_carga(args.url, registros, args.concurrencia))
+        return
+
+    for titulo, max_lote, espera_ms in [("Sin micro-batching (lote = 1)", 1, 0),
+                                        ("Con micro-batching (lote ≤ 256, espera 5 ms)", 256, 5)]:
+        servidor, url = servidor_local(max_lote, espera_ms)
+        try:
+            reportar(titulo, *ejecutar_carga(url, registros, args.concurrencia))
+        finally:
+            servidor.shutdown()
+            servidor.server_close()
+            servidor.RequestHandlerClass.batcher.cerrar()
+
+
+if __name__ == "__main__":
+    main()
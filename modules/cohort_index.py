@@ -0,0 +1,96 @@
+# modules/cohort_index.py
+import pandas as pd
+import numpy as np
+
+
+# Flags de riesgo generados por las apps de colores
+FLAGS_DESCRIPCION = {
+    'punto_estres': 'Estrés alto',
+    'punto_demandas': 'Demandas altas',
+    'punto_satisfaccion': 'Satisfacción < 5',
+    'punto_ausentismo': 'Ausentismo > 5 días',
+    'punto_rot_satisfaccion': 'Satisfacción < 4',
+    'punto_rot_antiguedad': 'Antigüedad < 12 meses',
+}
+
+# Columnas categóricas indexadas como un bitset por valor ("columna=valor")
+COLUMNAS_CATEGORICAS = ['area_trabajo', 'tipo_contrato', 'riesgo_enfermedad', 'riesgo_rotacion']
+
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+class CohortIndex:
+    """Índice de cohortes con cada flag y categoría almacenados como bits empaquetados"""
+
+    def __init__(self, n):
+        self.n = n
+        self.bitsets = {}
+        self.index = pd.RangeIndex(n)
+        self._todos = np.packbits(np.ones(n, dtype=bool))
+
+    @classmethod
+    def desde_datos(cls, data, analyzer):
+        """Construir el índice ejecutando las apps de colores sobre los datos"""
+        enfermedad = analyzer.detector_enfermedades_colores(data)
+        rotacion = analyzer.predictor_rotacion_colores(data)
+        indice = cls(len(data))
+        indice.index = data.index
+        for nombre in FLAGS_DESCRIPCION:
+            origen = enfermedad if nombre in enfermedad.columns else rotacion
+            if nombre in origen.columns:
+                indice.agregar(nombre, origen[nombre].to_numpy() == 1)
+        indice.agregar_categorias('riesgo_enfermedad', enfermedad['riesgo_enfermedad'])
+        indice.agregar_categorias('riesgo_rotacion', rotacion['riesgo_rotacion'])
+        for col in ('area_trabajo', 'tipo_contrato'):
+            if col in data.columns:
+                indice.agregar_categorias(col, data[col])
+        return indice
+
+    def agregar(self, nombre, mascara):
+        """Agregar un bitset a partir de una máscara booleana"""
+        self.bitsets[nombre] = np.packbits(np.asarray(mascara, dtype=bool))
+
+    def agregar_categorias(self, columna, valores):
+        """Un bitset por cada valor distinto de una columna categórica"""
+        codigos, categorias = pd.factorize(pd.Series(valores).astype(str))
+        for i, categoria in enumerate(categorias):
+            self.agregar(f'{columna}={categoria}', codigos == i)
+
+    def valores(self, columna):
+        """Valores indexados de una columna categórica"""
+        prefijo = f'{columna}='
+        return sorted(k[len(prefijo):] for k in self.bitsets if k.startswith(prefijo))
+
+    def consultar(self, todas=(), alguna=(), ninguna=()):
+        """
+        Bitset de la cohorte: cumple todas las claves de `todas`, al menos una
+        de `alguna` (si se indica) y ninguna de `ninguna`.
+        """
+        bits = self._todos.copy()
+        for clave in todas:
+            np.bitwise_and(bits, self.bitsets[clave], out=bits)
+        if alguna:
+            union = np.zeros_like(bits)
+            for clave in alguna:
+                np.bitwise_or(union, self.bitsets[clave], out=union)
+            np.bitwise_and(bits, union, out=bits)
+        for clave in ninguna:
+            np.bitwise_and(bits, np.invert(self.bitsets[clave]), out=bits)
+        return bits
+
+    def contar(self, bits=None, **consulta):
+        """Tamaño de la cohorte (popcount del bitset)"""
+        if bits is None:
+            bits = self.consultar(**consulta)
+        return int(_POPCOUNT[bits].sum(dtype=np.int64))
+
+    def filas(self, bits=None, **consulta):
+        """Etiquetas de índice de los colaboradores de la cohorte"""
+        if bits is None:
+            bits = self.consultar(**consulta)
+        posiciones = np.flatnonzero(np.unpackbits(bits, count=self.n))
+        return self.index[posiciones]
+
+    def memoria(self):
+        """Bytes ocupados por los bitsets"""
+        return sum(b.nbytes for b in self.bitsets.values())
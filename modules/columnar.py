@@ -0,0 +1,86 @@
+# modules/columnar.py
+import io
+
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+
+def _dtype_texto():
+    """
+    Texto respaldado por Arrow con semántica NaN (igual que el tipo str de pandas 3).
+
+    En pandas 2.0 no existe: se usa object y el texto se deja sin convertir.
+    """
+    try:
+        return pd.StringDtype('pyarrow', na_value=np.nan)
+    except TypeError:
+        pass
+    try:
+        # pandas 2.1 y 2.2
+        return pd.StringDtype('pyarrow_numpy')
+    except ValueError:
+        return np.dtype(object)
+
+
+TEXTO_ARROW = _dtype_texto()
+
+
+def a_columnar(df):
+    """
+    Pasar las columnas de texto a almacenamiento Arrow sin tocar las numéricas.
+
+    Las columnas object que contienen solo texto se convierten; el resto se
+    comparte con el DataFrame original (sin copia).
+    """
+    if TEXTO_ARROW == object:
+        return df
+    convertidas = {}
+    for col in df.columns:
+        serie = df[col]
+        if serie.dtype == object and pd.api.types.infer_dtype(serie, skipna=True) in ('string', 'empty'):
+            convertidas[col] = serie.astype(TEXTO_ARROW)
+    if not convertidas:
+        return df
+    resultado = df.copy(deep=False)
+    for col, serie in convertidas.items():
+        resultado[col] = serie
+    return resultado
+
+
+def leer_csv(archivo):
+    """Leer un CSV con el parser multihilo de Arrow y devolverlo en formato columnar"""
+    try:
+        return a_columnar(pd.read_csv(archivo, engine='pyarrow'))
+    except (ValueError, pa.ArrowInvalid):
+        # El parser de Arrow no admite algunos CSV irregulares: usar el de pandas
+        if hasattr(archivo, 'seek'):
+            archivo.seek(0)
+        return a_columnar(pd.read_csv(archivo))
+
+
+def combinar(dataframes):
+    """Concatenar solo cuando hay más de un DataFrame (un único archivo no se copia)"""
+    if len(dataframes) == 1:
+        return dataframes[0]
+    return a_columnar(pd.concat(dataframes, ignore_index=True))
+
+
+def exportar_csv(df):
+    """
+    CSV escrito directamente desde los buffers Arrow de las columnas.
+
+    El formato es el del escritor de Arrow, no el de to_csv: encabezados y
+    textos siempre entre comillas, booleanos como true/false y flotantes
+    enteros sin decimales (3.0 -> 3). Las tablas con columnas de tipos
+    mezclados se exportan con to_csv.
+    """
+    try:
+        tabla = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Columnas con tipos mezclados: exportar con pandas
+        return df.to_csv(index=False).encode('utf-8')
+    salida = io.BytesIO()
+    pa_csv.write_csv(tabla, salida, pa_csv.WriteOptions(quoting_style='needed'))
+    return salida.getvalue()
@@ -1,6 +1,8 @@
 # modules/data_extractor.py
 import pandas as pd
 import numpy as np
+from operator import itemgetter
+from openpyxl import load_workbook
 
 class DocumentProcessor:
     def extract_from_pdf(self, file_path):
@@ -16,6 +18,79 @@ class DocumentProcessor:
             print(f"Error leyendo Excel: {e}")
             return self._create_sample_data()
     
+    def extract_from_excel_streaming(self, file_path, columnas=None, max_filas_encabezado=20):
+        """
+        Extraer datos de Excel en modo streaming (solo lectura) de todas las hojas.
+        
+        Solo se conservan las `columnas` indicadas (todas si es None). La fila de
+        encabezado se detecta una vez y se reutiliza en las hojas con la misma
+        estructura; las hojas sin ninguna columna buscada se omiten.
+        """
+        libro = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            partes = []
+            encabezado_previo = None
+            
+            for hoja in libro.worksheets:
+                encabezado = None
+                if encabezado_previo is not None:
+                    fila_previa, nombres_previos = encabezado_previo
+                    fila = next(hoja.iter_rows(min_row=fila_previa, max_row=fila_previa, values_only=True), ())
+                    if tuple(_limpiar_encabezado(fila)) == nombres_previos:
+                        encabezado = encabezado_previo
+                if encabezado is None:
+                    encabezado = self._detectar_encabezado(hoja, columnas, max_filas_encabezado)
+                if encabezado is None:
+                    continue
+                encabezado_previo = encabezado
+                
+                fila_encabezado, nombres = encabezado
+                posiciones = [i for i, nombre in enumerate(nombres)
+                              if nombre and (columnas is None or nombre in columnas)
+                              and nombre not in nombres[:i]]
+                if not posiciones:
+                    continue
+                
+                # Leer solo el rango de columnas que contiene las proyectadas
+                primera, ultima = posiciones[0], posiciones[-1]
+                relativas = [i - primera for i in posiciones]
+                ancho = ultima - primera + 1
+                proyectar = itemgetter(*relativas) if len(relativas) > 1 else (lambda f: (f[relativas[0]],))
+                
+                filas = []
+                for fila in hoja.iter_rows(min_row=fila_encabezado + 1, min_col=primera + 1,
+                                           max_col=ultima + 1, values_only=True):
+                    if len(fila) < ancho:
+                        fila = tuple(fila) + (None,) * (ancho - len(fila))
+                    valores = proyectar(fila)
+                    if any(v is not None for v in valores):
+                        filas.append(valores)
+                
+                partes.append(pd.DataFrame.from_records(filas, columns=[nombres[i] for i in posiciones]))
+        finally:
+            libro.close()
+        
+        if not partes:
+            return pd.DataFrame(columns=columnas or [])
+        df = pd.concat(partes, ignore_index=True) if len(partes) > 1 else partes[0]
+        if columnas is not None:
+            df = df[[c for c in columnas if c in df.columns]]
+        return df.infer_objects()
+    
+    def _detectar_encabezado(self, hoja, columnas, max_filas):
+        """Buscar la fila de encabezado entre las primeras filas de la hoja"""
+        for numero, fila in enumerate(hoja.iter_rows(max_row=max_filas, values_only=True), start=1):
+            nombres = _limpiar_encabezado(fila)
+            if columnas is None:
+                encontrados = sum(1 for n in nombres if n)
+                minimo = 2
+            else:
+                encontrados = sum(1 for n in nombres if n in columnas)
+                minimo = min(2, len(columnas))
+            if encontrados >= minimo:
+                return numero, tuple(nombres)
+        return None
+    
     def extract_from_csv(self, file_path):
         """Extraer datos de CSV"""
         try:
@@ -45,4 +120,8 @@ class DocumentProcessor:
             'satisfaccion_laboral': np.random.randint(1, 11, n_samples),
             'ausentismo_dias': np.random.poisson(2, n_samples),
             'antiguedad_meses': np.random.randint(1, 60, n_samples)
-        })
\ No newline at end of file
+        })
+
+def _limpiar_encabezado(fila):
+    """Normalizar los nombres de una fila de encabezado"""
+    return [str(v).strip() if v is not None else '' for v in fila]
\ No newline at end of file
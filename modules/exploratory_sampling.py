@@ -0,0 +1,117 @@
+# modules/exploratory_sampling.py
+import pandas as pd
+import numpy as np
+
+
+class StratifiedSampler:
+    """Muestreo estratificado para corridas exploratorias sobre datasets grandes"""
+
+    def __init__(self, estratos=('area_trabajo', 'tipo_contrato'), n_objetivo=2000,
+                 min_por_estrato=2, confianza=0.95, seed=42):
+        self.estratos = list(estratos)
+        self.n_objetivo = n_objetivo
+        self.min_por_estrato = min_por_estrato
+        self.z = _Z_CONFIANZA.get(confianza, 1.96)
+        self.seed = seed
+
+    def muestrear(self, data):
+        """
+        Muestra estratificada con asignación proporcional.
+
+        Devuelve un subconjunto de `data` (conserva el índice original) con las
+        columnas de diseño `_estrato`, `_n_estrato` (filas muestreadas del
+        estrato) y `_N_estrato` (filas del estrato en la población).
+        """
+        estratos = [c for c in self.estratos if c in data.columns]
+        if estratos:
+            codigos = data.groupby(estratos, sort=False, dropna=False).ngroup().to_numpy()
+        else:
+            codigos = np.zeros(len(data), dtype=np.int64)
+
+        N = len(data)
+        tamanos = np.bincount(codigos) if N else np.zeros(0, dtype=np.int64)
+        if N <= self.n_objetivo:
+            asignados = tamanos
+        else:
+            asignados = np.round(tamanos * self.n_objetivo / N).astype(np.int64)
+            asignados = np.minimum(np.maximum(asignados, self.min_por_estrato), tamanos)
+
+        # Posiciones agrupadas por estrato (orden estable en O(N) para códigos pequeños)
+        # y selección sin reemplazo dentro de cada grupo
+        rng = np.random.default_rng(self.seed)
+        tipo = np.uint16 if len(tamanos) <= np.iinfo(np.uint16).max else np.int64
+        posiciones = np.argsort(codigos.astype(tipo), kind='stable')
+        limites = np.concatenate(([0], np.cumsum(tamanos)))
+        partes = [
+            posiciones[limites[h]:limites[h + 1]][rng.choice(tamanos[h], asignados[h], replace=False)]
+            for h in np.flatnonzero(asignados)
+        ]
+        seleccion = np.sort(np.concatenate(partes)) if partes else np.zeros(0, dtype=np.int64)
+
+        muestra = data.iloc[seleccion].copy()
+        codigos_muestra = codigos[seleccion]
+        muestra['_estrato'] = codigos_muestra
+        muestra['_n_estrato'] = asignados[codigos_muestra]
+        muestra['_N_estrato'] = tamanos[codigos_muestra]
+        return muestra
+
+    def estimar_tasa(self, indicador, muestra, por=None):
+        """
+        Estima la proporción de `indicador` (booleano alineado con `muestra`)
+        en la población, con intervalo de Wilson y corrección por población
+        finita. Si se indica `por` (valores alineados con `muestra`), estima
+        una tasa por grupo.
+
+        El intervalo usa el tamaño efectivo de muestra del diseño; la varianza
+        se calcula con tasas por estrato ajustadas hacia 1/2, de modo que un
+        estrato con 0 % o 100 % observado no da un intervalo de ancho cero
+        salvo que el estrato se haya censado completo.
+        """
+        base = pd.DataFrame({
+            'indicador': np.asarray(indicador, dtype=float),
+            'estrato': muestra['_estrato'].to_numpy(),
+            'n_h': muestra['_n_estrato'].to_numpy(),
+            'N_h': muestra['_N_estrato'].to_numpy(),
+        })
+        base['grupo'] = np.asarray(por) if por is not None else 'Total'
+
+        filas = []
+        for grupo, datos in base.groupby('grupo', sort=True):
+            por_estrato = datos.groupby('estrato').agg(
+                p_h=('indicador', 'mean'), n_h=('n_h', 'first'), N_h=('N_h', 'first')
+            )
+            N = por_estrato['N_h'].sum()
+            W = por_estrato['N_h'] / N
+            p = float((W * por_estrato['p_h']).sum())
+            inferior, superior = self._wilson(p, por_estrato, W)
+            filas.append({
+                'grupo': grupo,
+                'tasa': p,
+                'ic_inferior': inferior,
+                'ic_superior': superior,
+                'n_muestra': int(len(datos)),
+                'N_poblacion': int(N),
+            })
+        return pd.DataFrame(filas).set_index('grupo')
+
+    def _wilson(self, p, por_estrato, W):
+        """Intervalo de Wilson con el tamaño efectivo de muestra del diseño estratificado"""
+        z2 = self.z ** 2
+        n_h = por_estrato['n_h'].to_numpy(dtype=float)
+        x_h = por_estrato['p_h'].to_numpy() * n_h
+        # Tasas ajustadas (Agresti-Coull) solo para la varianza
+        p_ajust_h = (x_h + z2 / 2) / (n_h + z2)
+        p_ajust = float((W * p_ajust_h).sum())
+        fpc = 1 - n_h / por_estrato['N_h'].to_numpy()
+        varianza = float((W ** 2 * p_ajust_h * (1 - p_ajust_h) / np.maximum(n_h - 1, 1) * fpc).sum())
+        # 1 / n efectivo: 0 cuando todos los estratos están censados
+        inv_n = varianza / (p_ajust * (1 - p_ajust))
+        denominador = 1 + z2 * inv_n
+        centro = (p + z2 * inv_n / 2) / denominador
+        margen = self.z * np.sqrt(p * (1 - p) * inv_n + z2 * inv_n ** 2 / 4) / denominador
+        return max(0.0, centro - margen), min(1.0, centro + margen)
+
+
+COLUMNAS_DISENO = ['_estrato', '_n_estrato', '_N_estrato']
+
+_Z_CONFIANZA = {0.90: 1.645, 0.95: 1.96, 0.99: 2.576}
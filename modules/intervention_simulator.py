@@ -0,0 +1,157 @@
+# modules/intervention_simulator.py
+import pandas as pd
+import numpy as np
+
+
+NIVELES = {'Bajo': 0, 'Medio': 1, 'Alto': 2, 'Muy Alto': 3}
+NIVEL_ALTO = 2
+
+# Efecto de cada intervención sobre las variables de entrada:
+# niveles (nivel_estres, demandas_jornada) suben/bajan de nivel, numéricas se suman
+INTERVENCIONES = {
+    'Sin intervención': {},
+    'Capacitación': {'nivel_estres': -1},
+    'Rediseño puesto': {'demandas_jornada': -1},
+    'Apoyo psicológico': {'nivel_estres': -1, 'satisfaccion_laboral': 1},
+    'Flexibilidad horaria': {'demandas_jornada': -1, 'ausentismo_dias': -2},
+    'Programa de reconocimiento': {'satisfaccion_laboral': 2},
+}
+
+VARIABLES = ['nivel_estres', 'demandas_jornada', 'satisfaccion_laboral',
+             'ausentismo_dias', 'antiguedad_meses']
+
+
+class InterventionSimulator:
+    """Simulador what-if: aplica intervenciones y recalcula las apps de colores en lote"""
+
+    def __init__(self, intervenciones=None):
+        self.intervenciones = dict(intervenciones or INTERVENCIONES)
+        if 'Sin intervención' not in self.intervenciones:
+            self.intervenciones = {'Sin intervención': {}, **self.intervenciones}
+        self.nombres = list(self.intervenciones)
+
+    def preparar(self, data):
+        """Codificar las variables de entrada como arreglos numéricos (NaN si faltan)"""
+        entradas = {}
+        for var in VARIABLES:
+            if var not in data.columns:
+                continue
+            if var in ('nivel_estres', 'demandas_jornada'):
+                # Valores fuera de la escala no cuentan como nivel alto (igual que .isin)
+                entradas[var] = data[var].map(NIVELES).fillna(-1).to_numpy(dtype=np.int8)
+            else:
+                entradas[var] = pd.to_numeric(data[var], errors='coerce').to_numpy(dtype=float)
+        return entradas
+
+    def escenarios(self, entradas):
+        """Aplicar todas las intervenciones a la vez: cada variable pasa a forma (escenarios, n)"""
+        transformadas = {}
+        for var, valores in entradas.items():
+            deltas = np.array([self.intervenciones[nombre].get(var, 0) for nombre in self.nombres])
+            if var in ('nivel_estres', 'demandas_jornada'):
+                nuevos = np.clip(valores[None, :] + deltas[:, None], 0, 3)
+                # Niveles desconocidos no se modifican
+                transformadas[var] = np.where(valores[None, :] < 0, valores[None, :], nuevos)
+            elif var == 'satisfaccion_laboral':
+                transformadas[var] = np.clip(valores[None, :] + deltas[:, None], 1, 10)
+            else:
+                transformadas[var] = np.maximum(valores[None, :] + deltas[:, None], 0)
+        return transformadas
+
+    @staticmethod
+    def score_enfermedad(v):
+        """Mismo puntaje que detector_enfermedades_colores, vectorizado"""
+        score = 0
+        if 'nivel_estres' in v:
+            score = score + (v['nivel_estres'] >= NIVEL_ALTO)
+        if 'demandas_jornada' in v:
+            score = score + (v['demandas_jornada'] >= NIVEL_ALTO)
+        if 'satisfaccion_laboral' in v:
+            score = score + (v['satisfaccion_laboral'] < 5)
+        if 'ausentismo_dias' in v:
+            score = score + (v['ausentismo_dias'] > 5)
+        return np.asarray(score, dtype=np.int8)
+
+    @staticmethod
+    def score_rotacion(v):
+        """Mismo puntaje que predictor_rotacion_colores, vectorizado"""
+        score = 0
+        if 'satisfaccion_laboral' in v:
+            score = score + (v['satisfaccion_laboral'] < 4)
+        if 'nivel_estres' in v:
+            score = score + (v['nivel_estres'] >= NIVEL_ALTO)
+        if 'antiguedad_meses' in v:
+            score = score + (v['antiguedad_meses'] < 12)
+        return np.asarray(score, dtype=np.int8)
+
+    @staticmethod
+    def banda_enfermedad(score):
+        """Bandas de pd.cut(bins=[-1, 1, 2, 4]): 0=🟢, 1=🟡, 2=🔴"""
+        return np.digitize(score, [1, 2], right=True).astype(np.int8)
+
+    @staticmethod
+    def banda_rotacion(score):
+        """Bandas de pd.cut(bins=[-1, 0, 1, 3]): 0=🟢, 1=🟡, 2=🔴"""
+        return np.digitize(score, [0, 1], right=True).astype(np.int8)
+
+    def simular(self, data):
+        """
+        Recalcular las apps de colores para cada escenario x colaborador.
+
+        Devuelve (banda_enfermedad, banda_rotacion, score_total), cada uno con
+        forma (escenarios, n) y escenarios en el orden de `self.nombres`.
+        """
+        n = len(data)
+        v = self.escenarios(self.preparar(data))
+        forma = (len(self.nombres), n)
+        score_enf = np.broadcast_to(self.score_enfermedad(v), forma)
+        score_rot = np.broadcast_to(self.score_rotacion(v), forma)
+        return (self.banda_enfermedad(score_enf), self.banda_rotacion(score_rot),
+                score_enf.astype(np.int16) + score_rot)
+
+    def ranking_por_area(self, data, area_col='area_trabajo'):
+        """Ranking de intervenciones por reducción de riesgo alto (🔴) en cada área"""
+        banda_enf, banda_rot, _ = self.simular(data)
+        if area_col in data.columns:
+            codigos, areas = pd.factorize(data[area_col].astype(str))
+        else:
+            codigos, areas = np.zeros(len(data), dtype=np.int64), pd.Index(['Total'])
+
+        n_esc, n_areas = len(self.nombres), len(areas)
+        tamanos = np.bincount(codigos, minlength=n_areas).astype(float)
+        # Conteo por (escenario, área) con un único bincount sobre índices aplanados
+        indice = (np.arange(n_esc)[:, None] * n_areas + codigos[None, :]).ravel()
+        alto_enf = np.bincount(indice, weights=(banda_enf == 2).ravel(),
+                               minlength=n_esc * n_areas).reshape(n_esc, n_areas)
+        alto_rot = np.bincount(indice, weights=(banda_rot == 2).ravel(),
+                               minlength=n_esc * n_areas).reshape(n_esc, n_areas)
+        tasa_enf = alto_enf / np.maximum(tamanos, 1)
+        tasa_rot = alto_rot / np.maximum(tamanos, 1)
+
+        ranking = pd.DataFrame({
+            'area_trabajo': np.tile(np.asarray(areas), n_esc),
+            'intervencion': np.repeat(self.nombres, n_areas),
+            'colaboradores': np.tile(tamanos.astype(int), n_esc),
+            'riesgo_enfermedad_alto': tasa_enf.ravel(),
+            'reduccion_enfermedad': (tasa_enf[0] - tasa_enf).ravel(),
+            'riesgo_rotacion_alto': tasa_rot.ravel(),
+            'reduccion_rotacion': (tasa_rot[0] - tasa_rot).ravel(),
+        })
+        ranking['reduccion_total'] = ranking['reduccion_enfermedad'] + ranking['reduccion_rotacion']
+        ranking = ranking[ranking['intervencion'] != 'Sin intervención']
+        ranking = ranking.sort_values(['area_trabajo', 'reduccion_total'], ascending=[True, False],
+                                      kind='stable')
+        ranking['ranking'] = ranking.groupby('area_trabajo').cumcount() + 1
+        return ranking.reset_index(drop=True)
+
+    def mejor_intervencion(self, data):
+        """Intervención con mayor reducción del puntaje combinado para cada colaborador"""
+        _, _, score = self.simular(data)
+        reduccion = score[0][None, :] - score[1:]
+        mejor = reduccion.argmax(axis=0)
+        ganancia = reduccion[mejor, np.arange(len(data))]
+        base = score[0].astype(float)
+        nombres = np.array(self.nombres[1:], dtype=object)
+        intervencion = np.where(ganancia > 0, nombres[mejor], 'Monitoreo periódico')
+        mejora = np.divide(ganancia, base, out=np.zeros(len(data)), where=base > 0)
+        return intervencion, mejora
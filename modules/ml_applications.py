@@ -5,14 +5,43 @@ from sklearn.ensemble import RandomForestClassifier
 from sklearn.cluster import KMeans
 from sklearn.preprocessing import LabelEncoder
 import streamlit as st
+from intervention_simulator import InterventionSimulator
 
 class PsychosocialAnalyzer:
+    # Columnas de entrada que usa cada aplicación (para proyección en la ingesta)
+    COLUMNAS_BASE = ['id_colaborador', 'nombre', 'area_trabajo', 'tipo_contrato']
+    COLUMNAS_REQUERIDAS = {
+        'alerta_temprana': ['nivel_estres'],
+        'recomendador_intervenciones': ['nivel_estres', 'demandas_jornada', 'satisfaccion_laboral'],
+        'patrones_estres': ['nivel_estres', 'demandas_jornada'],
+        'modelo_rotacion': ['satisfaccion_laboral'],
+        'predictor_incidentes': ['nivel_estres'],
+        'perfiles_resiliencia': [],
+        'efectividad_intervenciones': ['nivel_estres', 'demandas_jornada', 'satisfaccion_laboral',
+                                       'ausentismo_dias', 'antiguedad_meses'],
+        'simulador_intervenciones': ['nivel_estres', 'demandas_jornada', 'satisfaccion_laboral',
+                                     'ausentismo_dias', 'antiguedad_meses'],
+        'detector_enfermedades_colores': ['nivel_estres', 'demandas_jornada',
+                                          'satisfaccion_laboral', 'ausentismo_dias'],
+        'predictor_rotacion_colores': ['satisfaccion_laboral', 'nivel_estres', 'antiguedad_meses'],
+    }
+
     def __init__(self):
         self.le = LabelEncoder()
     
+    @classmethod
+    def columnas_requeridas(cls, metodos):
+        """Columnas necesarias para ejecutar las aplicaciones indicadas"""
+        columnas = list(cls.COLUMNAS_BASE)
+        for metodo in metodos:
+            for col in cls.COLUMNAS_REQUERIDAS.get(metodo, []):
+                if col not in columnas:
+                    columnas.append(col)
+        return columnas
+    
     def alerta_temprana(self, data):
         """App 1: Sistema de alerta temprana de comportamientos de riesgo"""
-        df = data.copy()
+        df = data.copy(deep=False)
         
         # Crear variable objetivo simulada
         if 'nivel_estres' in df.columns:
@@ -26,7 +55,7 @@ class PsychosocialAnalyzer:
     
     def recomendador_intervenciones(self, data):
         """App 5: Recomendador de intervenciones personalizadas"""
-        df = data.copy()
+        df = data.copy(deep=False)
         
         def generar_recomendacion(fila):
             recomendaciones = []
@@ -52,7 +81,7 @@ class PsychosocialAnalyzer:
     
     def patrones_estres(self, data):
         """App 3: Detección de patrones de estrés por clustering"""
-        df = data.copy()
+        df = data.copy(deep=False)
         
         try:
             # Preparar datos para clustering
@@ -82,7 +111,7 @@ class PsychosocialAnalyzer:
     
     def modelo_rotacion(self, data):
         """App 2: Modelo de rotación voluntaria"""
-        df = data.copy()
+        df = data.copy(deep=False)
         
         # Simular riesgo de rotación
         if 'satisfaccion_laboral' in df.columns:
@@ -96,7 +125,7 @@ class PsychosocialAnalyzer:
     
     def predictor_incidentes(self, data):
         """App 4: Predictor de incidentes"""
-        df = data.copy()
+        df = data.copy(deep=False)
         
         # Simular predictor de incidentes
         if 'nivel_estres' in df.columns:
@@ -110,7 +139,7 @@ class PsychosocialAnalyzer:
     
     def perfiles_resiliencia(self, data):
         """App 6: Perfiles de resiliencia"""
-        df = data.copy()
+        df = data.copy(deep=False)
         
         # Calcular score de resiliencia simple
         df['score_resiliencia'] = np.random.randint(1, 10, len(df))
@@ -122,16 +151,18 @@ class PsychosocialAnalyzer:
     
     def efectividad_intervenciones(self, data):
         """App 7: Efectividad de intervenciones"""
-        df = data.copy()
+        df = data.copy(deep=False)
         
-        # Simular datos históricos y efectividad
-        df['mejora_esperada'] = np.random.uniform(0.1, 0.8, len(df))
-        df['intervencion_recomendada'] = np.random.choice(
-            ['Capacitación', 'Rediseño puesto', 'Apoyo psicológico', 'Flexibilidad horaria'], 
-            len(df)
-        )
+        # Intervención con mayor reducción simulada del puntaje de riesgo (apps de colores)
+        intervencion, mejora = InterventionSimulator().mejor_intervencion(df)
+        df['mejora_esperada'] = mejora
+        df['intervencion_recomendada'] = intervencion
         
         return df
+    
+    def simulador_intervenciones(self, data):
+        """App 8: Simulador what-if de intervenciones por área"""
+        return InterventionSimulator().ranking_por_area(data)
 
     # =============================================
     # NUEVAS FUNCIONES CON SISTEMA DE COLORES
@@ -141,7 +172,7 @@ class PsychosocialAnalyzer:
         """
         Versión simple con sistema de colores para enfermedades laborales
         """
-        df = data.copy()
+        df = data.copy(deep=False)
         
         # Sistema simple de scoring
         score = 0
@@ -181,7 +212,7 @@ class PsychosocialAnalyzer:
         """
         Versión simple con sistema de colores para rotación
         """
-        df = data.copy()
+        df = data.copy(deep=False)
         
         score = 0
         
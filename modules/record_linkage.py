@@ -0,0 +1,266 @@
+# modules/record_linkage.py
+import re
+import unicodedata
+from difflib import SequenceMatcher
+
+import pandas as pd
+import numpy as np
+
+
+class RecordLinker:
+    """Deduplicación y vinculación de registros entre varios archivos"""
+
+    def __init__(self, id_col='id_colaborador', name_col='nombre', area_col='area_trabajo',
+                 umbral_nombre=0.9, umbral_area=0.85, ventana=5):
+        self.id_col = id_col
+        self.name_col = name_col
+        self.area_col = area_col
+        self.umbral_nombre = umbral_nombre
+        self.umbral_area = umbral_area
+        self.ventana = ventana
+        self.stats = {}
+
+    def vincular(self, fuentes):
+        """
+        Vincula registros de varias fuentes y devuelve la tabla canónica.
+
+        `fuentes` es una lista de tuplas (nombre_fuente, DataFrame). Devuelve
+        (tabla_canonica, linaje): una fila por colaborador con las columnas
+        `fuentes_origen` y `registros_origen`, y el mapeo de cada fila original
+        a su colaborador canónico.
+
+        Si no hay duplicados la tabla canónica comparte las columnas de los
+        datos combinados; si los hay, se copian solo las filas representativas.
+        """
+        if not fuentes:
+            self.stats = {'registros_entrada': 0, 'registros_canonicos': 0,
+                          'duplicados_id': 0, 'duplicados_nombre': 0, 'comparaciones': 0}
+            return pd.DataFrame(), pd.DataFrame(columns=['fuente', 'fila_fuente', 'id_canonico'])
+
+        partes = [df.reset_index(drop=True) for _, df in fuentes]
+        longitudes = [len(parte) for parte in partes]
+        todos = partes[0] if len(partes) == 1 else pd.concat(partes, ignore_index=True)
+        fuente_fila = pd.Series(np.repeat(np.array([nombre for nombre, _ in fuentes], dtype=object),
+                                          longitudes))
+        n = len(todos)
+        padres = np.arange(n)
+
+        # Paso 1: IDs exactos mediante índice hash (factorize)
+        duplicados_id = 0
+        if self.id_col in todos.columns:
+            codigos, _ = pd.factorize(todos[self.id_col].astype('string').str.strip())
+            con_id = codigos >= 0
+            # El primer registro de cada ID actúa como representante
+            primero = pd.Series(np.flatnonzero(con_id)).groupby(codigos[con_id]).transform('min').to_numpy()
+            padres[con_id] = primero
+            duplicados_id = int(con_id.sum() - len(np.unique(codigos[con_id])))
+
+        # Paso 2: nombres casi duplicados mediante índice de bloqueo por área
+        duplicados_nombre, comparaciones = 0, 0
+        if self.name_col in todos.columns:
+            duplicados_nombre, comparaciones = self._vincular_nombres(todos, padres)
+
+        # La raíz de cada grupo es su primera fila: los grupos quedan en orden de aparición
+        raices = self._raiz_todos(padres)
+        representantes = np.flatnonzero(raices == np.arange(n))
+        cluster = np.searchsorted(representantes, raices)
+
+        tabla_canonica = self._construir_canonica(todos, representantes, cluster, fuente_fila)
+        linaje = pd.DataFrame({
+            'fuente': fuente_fila,
+            'fila_fuente': np.concatenate([np.arange(m) for m in longitudes]),
+            'id_canonico': cluster,
+        })
+
+        self.stats = {
+            'registros_entrada': n,
+            'registros_canonicos': len(tabla_canonica),
+            'duplicados_id': duplicados_id,
+            'duplicados_nombre': duplicados_nombre,
+            'comparaciones': comparaciones,
+        }
+        return tabla_canonica, linaje
+
+    def _vincular_nombres(self, todos, padres):
+        """
+        Une nombres similares dentro de cada bloque (área canónica) con vecindario ordenado.
+
+        La unión es de enlace completo: todos los nombres distintos de los dos
+        grupos deben superar el umbral y tener los mismos números. Un grupo
+        nunca reúne dos IDs distintos.
+        """
+        nombres = _normalizar_serie(todos[self.name_col])
+        if self.area_col in todos.columns:
+            bloques = self._canonizar_areas(todos[self.area_col])
+        else:
+            bloques = pd.Series('', index=todos.index)
+
+        # Estado por raíz tras el paso de IDs exactos: ID único y nombres distintos
+        raices = self._raiz_todos(padres)
+        id_raiz = {}
+        ids_fila = [None] * len(raices)
+        if self.id_col in todos.columns:
+            ids = todos[self.id_col].astype('string').str.strip()
+            con_id = ids.notna().to_numpy()
+            id_raiz = dict(zip(raices[con_id].tolist(), ids[con_id].tolist()))
+            ids_fila = ids.astype(object).where(con_id, None).tolist()
+        validos = nombres != ''
+        # Los nombres de cada raíz se reúnen solo cuando la ventana la compara
+        nombres_arr = nombres.to_numpy(dtype=object)
+        tamanos = np.bincount(raices, minlength=len(raices))
+        orden_raiz = np.argsort(raices, kind='stable')
+        raices_ordenadas = raices[orden_raiz]
+        nombres_raiz = {}
+
+        def nombres_de(raiz):
+            if raiz not in nombres_raiz:
+                if tamanos[raiz] == 1:
+                    miembros = (raiz,)
+                else:
+                    inicio = np.searchsorted(raices_ordenadas, raiz)
+                    miembros = orden_raiz[inicio:inicio + tamanos[raiz]]
+                nombres_raiz[raiz] = {nombres_arr[i] for i in miembros if nombres_arr[i]}
+            return nombres_raiz[raiz]
+
+        indice = pd.DataFrame({'nombre': nombres[validos], 'bloque': bloques[validos]})
+        similitudes = {}
+        uniones, comparaciones = 0, 0
+
+        def compatibles(grupo_a, grupo_b):
+            for x in grupo_a:
+                for y in grupo_b:
+                    if _digitos(x) != _digitos(y):
+                        return False
+                    par = (x, y) if x < y else (y, x)
+                    if par not in similitudes:
+                        similitudes[par] = SequenceMatcher(None, x, y).ratio()
+                    if similitudes[par] < self.umbral_nombre:
+                        return False
+            return True
+
+        for _, bloque in indice.groupby('bloque', sort=False):
+            if len(bloque) < 2:
+                continue
+            # Dos pasadas: por nombre y por nombre invertido, para captar errores al inicio
+            for clave in (bloque['nombre'], bloque['nombre'].str[::-1]):
+                orden = clave.sort_values(kind='stable').index.tolist()
+                for i in range(len(orden)):
+                    a = orden[i]
+                    for b in orden[i + 1:i + 1 + self.ventana]:
+                        comparaciones += 1
+                        # Dos filas con IDs distintos nunca terminan en el mismo grupo
+                        id_a, id_b = ids_fila[a], ids_fila[b]
+                        if id_a is not None and id_b is not None and id_a != id_b:
+                            continue
+                        ra, rb = self._raiz(padres, a), self._raiz(padres, b)
+                        if ra == rb:
+                            continue
+                        id_a, id_b = id_raiz.get(ra), id_raiz.get(rb)
+                        if id_a is not None and id_b is not None and id_a != id_b:
+                            continue
+                        if not compatibles(nombres_de(ra), nombres_de(rb)):
+                            continue
+                        nueva, vieja = min(ra, rb), max(ra, rb)
+                        padres[vieja] = nueva
+                        nombres_raiz[nueva] = nombres_raiz[ra] | nombres_raiz.pop(vieja)
+                        if id_a is not None or id_b is not None:
+                            id_raiz[nueva] = id_a if id_a is not None else id_b
+                        uniones += 1
+
+        return uniones, comparaciones
+
+    def _canonizar_areas(self, areas):
+        """Agrupa variantes de un área (tildes, mayúsculas, errores menores) en un valor canónico"""
+        normalizadas = _normalizar_serie(areas)
+        canonicas = []
+        mapeo = {}
+        for valor in normalizadas.value_counts().index:
+            destino = next(
+                (c for c in canonicas if SequenceMatcher(None, valor, c).ratio() >= self.umbral_area),
+                None
+            )
+            if destino is None:
+                canonicas.append(valor)
+                destino = valor
+            mapeo[valor] = destino
+        return normalizadas.map(mapeo).fillna('')
+
+    def _construir_canonica(self, todos, representantes, cluster, fuente_fila):
+        """
+        Una fila por colaborador: la fila representativa (la primera del grupo)
+        con sus valores nulos completados con el primer valor no nulo del grupo.
+        """
+        tamanos = np.bincount(cluster, minlength=len(representantes))
+        if len(representantes) == len(todos):
+            # Sin fusiones: se comparten las columnas de los datos combinados
+            tabla = todos.copy(deep=False)
+        else:
+            tabla = todos.take(representantes).reset_index(drop=True)
+            en_grupo = tamanos[cluster] > 1
+            for col in tabla.columns:
+                nulos = tabla[col].isna().to_numpy() & (tamanos > 1)
+                if not nulos.any():
+                    continue
+                candidatas = np.flatnonzero(en_grupo & todos[col].notna().to_numpy())
+                grupos, primeras = np.unique(cluster[candidatas], return_index=True)
+                origen = np.full(len(tabla), -1)
+                origen[grupos] = candidatas[primeras]
+                destino = np.flatnonzero(nulos & (origen >= 0))
+                if len(destino):
+                    valores = tabla[col].copy()
+                    valores.iloc[destino] = todos[col].iloc[origen[destino]].to_numpy()
+                    tabla[col] = valores
+        tabla['fuentes_origen'] = self._fuentes_por_cluster(fuente_fila, cluster, len(tabla))
+        tabla['registros_origen'] = tamanos
+        return tabla
+
+    @staticmethod
+    def _fuentes_por_cluster(fuentes, cluster, n_clusters):
+        """Fuentes de cada colaborador ('a; b' en orden de carga) con una máscara de bits por cluster"""
+        codigos, nombres = pd.factorize(fuentes)
+        if len(nombres) > 62:
+            return fuentes.groupby(cluster, sort=True).agg(lambda s: '; '.join(dict.fromkeys(s))).to_numpy()
+        mascaras = np.zeros(n_clusters, dtype=np.int64)
+        np.bitwise_or.at(mascaras, cluster, np.left_shift(1, codigos, dtype=np.int64))
+        unicas, inversa = np.unique(mascaras, return_inverse=True)
+        textos = np.array([
+            '; '.join(nombre for j, nombre in enumerate(nombres) if (mascara >> j) & 1)
+            for mascara in unicas.tolist()
+        ], dtype=object)
+        return textos[inversa]
+
+    @staticmethod
+    def _raiz(padres, i):
+        while padres[i] != i:
+            padres[i] = padres[padres[i]]
+            i = padres[i]
+        return i
+
+    @staticmethod
+    def _raiz_todos(padres):
+        # Compresión de caminos vectorizada hasta que cada nodo apunte a su raíz
+        raices = padres.copy()
+        while True:
+            siguiente = raices[raices]
+            if np.array_equal(siguiente, raices):
+                return raices
+            raices = siguiente
+
+
+def _normalizar_serie(serie):
+    """Minúsculas, sin tildes y con espacios colapsados ('' para faltantes)"""
+    texto = serie.astype('string').str.normalize('NFKD').str.replace(_COMBINANTES, '', regex=True)
+    texto = texto.str.lower().str.replace('_', ' ', regex=False)
+    return texto.str.replace(r'\s+', ' ', regex=True).str.strip().fillna('').astype(object)
+
+
+# Marcas diacríticas combinantes que deja NFKD (tildes, diéresis, virgulilla de la ñ)
+_COMBINANTES = '[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]'
+
+
+def _digitos(nombre):
+    """Números presentes en un nombre: nombres con números distintos no se fusionan"""
+    return tuple(_NUMEROS.findall(nombre))
+
+
+_NUMEROS = re.compile(r'\d+')
@@ -0,0 +1,281 @@
+# modules/scoring_service.py
+"""
+Servicio HTTP local de scoring para integración con el HRIS.
+
+Uso: python modules/scoring_service.py [--host 127.0.0.1] [--port 8765]
+
+    POST /score   un colaborador (objeto JSON) o varios (lista) -> resultados
+    GET  /stats   percentiles de latencia (objetos y listas) y tamaño de lotes
+    GET  /health  estado del servicio
+
+Los campos de scoring se validan por registro (400 si el tipo es inválido) y
+los que faltan se tratan como vacíos, igual en cualquier lote.
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from ml_applications import PsychosocialAnalyzer
+from columnar import TEXTO_ARROW
+
+CAMPOS_TEXTO = ['nivel_estres', 'demandas_jornada']
+CAMPOS_NUMERICOS = ['satisfaccion_laboral', 'ausentismo_dias', 'antiguedad_meses']
+ESQUEMA = ['id_colaborador'] + CAMPOS_TEXTO + CAMPOS_NUMERICOS
+
+
+class RegistroInvalido(ValueError):
+    """Registro con campos de scoring de tipo inválido"""
+
+
+def validar_registro(registro):
+    """Comprobar los tipos de los campos de scoring; los numéricos aceptan texto numérico"""
+    if not isinstance(registro, dict):
+        raise RegistroInvalido("Se espera un objeto JSON por colaborador")
+    for campo in CAMPOS_TEXTO:
+        valor = registro.get(campo)
+        if valor is not None and not isinstance(valor, str):
+            raise RegistroInvalido(f"'{campo}' debe ser texto")
+    for campo in CAMPOS_NUMERICOS:
+        valor = registro.get(campo)
+        if valor is None:
+            continue
+        if isinstance(valor, bool) or not isinstance(valor, (int, float, str)) \
+                or pd.isna(pd.to_numeric(valor, errors='coerce')):
+            raise RegistroInvalido(f"'{campo}' debe ser numérico")
+    return registro
+
+
+class _Solicitud:
+    __slots__ = ('registro', 'resultado', 'error', 'listo', 'inicio')
+
+    def __init__(self, registro):
+        self.registro = registro
+        self.resultado = None
+        self.error = None
+        self.listo = threading.Event()
+        self.inicio = time.perf_counter()
+
+
+class MicroBatcher:
+    """Agrupa solicitudes concurrentes en lotes y las puntúa de forma vectorizada"""
+
+    def __init__(self, max_lote=256, espera_ms=5, historial=10000):
+        self.max_lote = max_lote
+        self.espera = espera_ms / 1000
+        self.analyzer = PsychosocialAnalyzer()
+        self._cola = deque()
+        self._condicion = threading.Condition()
+        self._latencias = deque(maxlen=historial)
+        self._lotes = 0
+        self._puntuados = 0
+        self._activo = True
+        self._hilo = threading.Thread(target=self._bucle, daemon=True)
+        self._hilo.start()
+        # Calentar el analizador y las rutas de pandas antes de la primera solicitud
+        self.puntuar_lote([{'id_colaborador': 0, 'nivel_estres': 'Bajo', 'demandas_jornada': 'Bajo',
+                            'satisfaccion_laboral': 5, 'ausentismo_dias': 0, 'antiguedad_meses': 12}])
+
+    def puntuar(self, registro, timeout=30):
+        """Valida y encola un colaborador y espera su resultado"""
+        solicitud = _Solicitud(validar_registro(registro))
+        with self._condicion:
+            self._cola.append(solicitud)
+            self._condicion.notify()
+        if not solicitud.listo.wait(timeout):
+            raise TimeoutError("Tiempo de espera agotado para el scoring")
+        if solicitud.error is not None:
+            raise solicitud.error
+        return solicitud.resultado
+
+    def puntuar_lista(self, registros):
+        """Valida y puntúa una lista ya agrupada por el cliente, registrando su latencia"""
+        inicio = time.perf_counter()
+        for registro in registros:
+            validar_registro(registro)
+        resultados = self.puntuar_lote(registros) if registros else []
+        with self._condicion:
+            self._lotes += 1
+            self._puntuados += len(registros)
+            self._latencias.append(time.perf_counter() - inicio)
+        return resultados
+
+    def puntuar_lote(self, registros):
+        """Aplica las apps de alertas y de colores a una lista de colaboradores"""
+        df = pd.DataFrame.from_records(registros)
+        # Esquema fijo: los campos ausentes son nulos sin importar el resto del lote
+        tiene_id = 'id_colaborador' in df.columns
+        df = df.reindex(columns=ESQUEMA)
+        for campo in CAMPOS_TEXTO:
+            df[campo] = df[campo].astype(TEXTO_ARROW)
+        for campo in CAMPOS_NUMERICOS:
+            df[campo] = pd.to_numeric(df[campo], errors='coerce')
+        alertas = self.analyzer.alerta_temprana(df)
+        enfermedad = self.analyzer.detector_enfermedades_colores(df)
+        rotacion = self.analyzer.predictor_rotacion_colores(df)
+
+        salida = pd.DataFrame({
+            'riesgo_alto': alertas['riesgo_alto'].astype(int),
+            'riesgo_enfermedad': enfermedad['riesgo_enfermedad'].astype(str),
+            'alerta_depresion': enfermedad['alerta_depresion'],
+            'alerta_ansiedad': enfermedad['alerta_ansiedad'],
+            'riesgo_rotacion': rotacion['riesgo_rotacion'].astype(str),
+        })
+        if tiene_id:
+            salida.insert(0, 'id_colaborador', df['id_colaborador'])
+        return json.loads(salida.to_json(orient='records', force_ascii=False))
+
+    def estadisticas(self):
+        """Percentiles de latencia (ms) y contadores de lotes"""
+        with self._condicion:
+            latencias = np.array(self._latencias) * 1000
+            stats = {
+                'lotes': self._lotes,
+                'puntuados': self._puntuados,
+                'tamano_medio_lote': self._puntuados / self._lotes if self._lotes else 0,
+                'en_cola': len(self._cola),
+            }
+        if len(latencias):
+            p50, p95, p99 = np.percentile(latencias, [50, 95, 99])
+            stats.update({'latencia_p50_ms': p50, 'latencia_p95_ms': p95,
+                          'latencia_p99_ms': p99, 'latencia_max_ms': float(latencias.max())})
+        return stats
+
+    def cerrar(self):
+        with self._condicion:
+            self._activo = False
+            self._condicion.notify()
+        self._hilo.join()
+
+    def _bucle(self):
+        while True:
+            with self._condicion:
+                while self._activo and not self._cola:
+                    self._condicion.wait()
+                if not self._activo:
+                    return
+                # Esperar brevemente a que lleguen más solicitudes para formar el lote
+                limite = time.perf_counter() + self.espera
+                while len(self._cola) < self.max_lote:
+                    restante = limite - time.perf_counter()
+                    if restante <= 0:
+                        break
+                    self._condicion.wait(restante)
+                lote = [self._cola.popleft() for _ in range(min(self.max_lote, len(self._cola)))]
+
+            try:
+                resultados = self.puntuar_lote([s.registro for s in lote])
+                for solicitud, resultado in zip(lote, resultados):
+                    solicitud.resultado = resultado
+            except Exception:
+                # Reintentar uno a uno para que un registro defectuoso no afecte al resto
+                for solicitud in lote:
+                    try:
+                        solicitud.resultado = self.puntuar_lote([solicitud.registro])[0]
+                    except Exception as e:
+                        solicitud.error = e
+
+            fin = time.perf_counter()
+            with self._condicion:
+                self._lotes += 1
+                self._puntuados += len(lote)
+                for solicitud in lote:
+                    self._latencias.append(fin - solicitud.inicio)
+            for solicitud in lote:
+                solicitud.listo.set()
+
+
+class ScoringHandler(BaseHTTPRequestHandler):
+    batcher = None
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._responder(200, {'estado': 'ok'})
+        elif self.path == '/stats':
+            self._responder(200, self.batcher.estadisticas())
+        else:
+            self._responder(404, {'error': 'Ruta no encontrada'})
+
+    def do_POST(self):
+        if self.path != '/score':
+            self._responder(404, {'error': 'Ruta no encontrada'})
+            return
+        try:
+            longitud = int(self.headers.get('Content-Length', 0))
+            cuerpo = json.loads(self.rfile.read(longitud) or b'null')
+        except (ValueError, json.JSONDecodeError) as e:
+            self._responder(400, {'error': f'JSON inválido: {e}'})
+            return
+
+        try:
+            if isinstance(cuerpo, dict):
+                self._responder(200, self.batcher.puntuar(cuerpo))
+            elif isinstance(cuerpo, list) and all(isinstance(r, dict) for r in cuerpo):
+                # Las listas ya forman un lote: se puntúan directamente
+                self._responder(200, self.batcher.puntuar_lista(cuerpo))
+            else:
+                self._responder(400, {'error': 'Se espera un objeto o una lista de objetos'})
+        except RegistroInvalido as e:
+            self._responder(400, {'error': str(e)})
+        except Exception as e:
+            self._responder(500, {'error': str(e)})
+
+    def log_message(self, format, *args):
+        pass
+
+    def _responder(self, codigo, contenido):
+        datos = json.dumps(contenido, ensure_ascii=False, default=_a_json).encode('utf-8')
+        self.send_response(codigo)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+
+
+class ScoringServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Cola de conexiones amplia para ráfagas de solicitudes concurrentes
+    request_queue_size = 256
+
+
+def crear_servidor(host='127.0.0.1', port=8765, max_lote=256, espera_ms=5):
+    """Servidor HTTP con un MicroBatcher compartido (port=0 elige un puerto libre)"""
+    handler = type('Handler', (ScoringHandler,), {'batcher': MicroBatcher(max_lote, espera_ms)})
+    return ScoringServer((host, port), handler)
+
+
+def _a_json(valor):
+    if isinstance(valor, np.generic):
+        return valor.item()
+    raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servicio local de scoring psicosocial")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--max-lote', type=int, default=256)
+    parser.add_argument('--espera-ms', type=float, default=5)
+    args = parser.parse_args()
+
+    servidor = crear_servidor(args.host, args.port, args.max_lote, args.espera_ms)
+    print(f"🌐 Servicio de scoring en http://{args.host}:{servidor.server_address[1]}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        servidor.RequestHandlerClass.batcher.cerrar()
+
+
+if __name__ == "__main__":
+    main()
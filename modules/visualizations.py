@@ -0,0 +1,189 @@
+# modules/visualizations.py
+import io
+import re
+
+import pandas as pd
+import numpy as np
+import streamlit as st
+from matplotlib.figure import Figure
+
+
+BANDAS = ['🟢 Bajo', '🟡 Medio', '🔴 Alto']
+MAX_CATEGORIAS = 30
+MAX_BINS = 40
+
+# Las fuentes de matplotlib no incluyen emojis: se quitan de títulos y etiquetas
+_EMOJIS = re.compile('[\U0001F300-\U0001FAFF\u2600-\u27BF\uFE0F]')
+
+# Flags de las apps de colores que se resumen por área
+FLAGS_MAPA = {
+    'punto_estres': 'Estrés alto',
+    'punto_demandas': 'Demandas altas',
+    'punto_satisfaccion': 'Satisfacción baja',
+    'punto_ausentismo': 'Ausentismo alto',
+    'punto_rot_satisfaccion': 'Satisfacción < 4',
+    'punto_rot_antiguedad': 'Antigüedad < 12m',
+}
+
+
+def preparar_graficos(key, result, original_data):
+    """
+    Series listas para graficar de un resultado, calculadas una sola vez por análisis.
+
+    Devuelve un diccionario con 'conteos' (métricas), 'barras' (series para
+    st.bar_chart), 'heatmaps' (tablas) e 'histogramas' ((conteos, bordes)),
+    ya agregados y limitados en tamaño.
+    """
+    graficos = {'conteos': {}, 'barras': {}, 'heatmaps': {}, 'histogramas': {}}
+    areas = None
+    if key != 'simulacion' and 'area_trabajo' in original_data.columns:
+        areas = original_data['area_trabajo'].reindex(result.index).astype(str)
+
+    if key == 'alertas' and 'riesgo_alto' in result.columns:
+        graficos['conteos']['riesgo_alto'] = int(result['riesgo_alto'].sum())
+        if areas is not None:
+            graficos['barras']['Riesgo por Área'] = _limitar(result['riesgo_alto'].groupby(areas).mean())
+            if 'nivel_estres' in result.columns:
+                graficos['heatmaps']['Nivel de estrés por área'] = _tabla_cruzada(areas, result['nivel_estres'])
+
+    elif key == 'recomendaciones' and 'recomendacion' in result.columns:
+        graficos['barras']['Frecuencia de Recomendaciones'] = _limitar(result['recomendacion'].value_counts())
+
+    elif key == 'estres' and 'cluster' in result.columns:
+        graficos['conteos']['clusters'] = result['cluster'].value_counts()
+        if 'nivel_estres' in result.columns:
+            graficos['heatmaps']['Nivel de estrés por cluster'] = _tabla_cruzada(
+                result['cluster'].map(lambda c: f'Cluster {c}'), result['nivel_estres']
+            )
+
+    elif key == 'rotacion' and 'riesgo_rotacion' in result.columns:
+        graficos['conteos']['riesgo_rotacion'] = int(result['riesgo_rotacion'].sum())
+        if 'probabilidad_rotacion' in result.columns:
+            graficos['histogramas']['Probabilidad de rotación'] = _histograma(result['probabilidad_rotacion'])
+
+    elif key == 'resiliencia' and 'score_resiliencia' in result.columns:
+        graficos['histogramas']['Score de resiliencia'] = _histograma(result['score_resiliencia'])
+
+    elif key == 'efectividad' and 'mejora_esperada' in result.columns:
+        graficos['histogramas']['Mejora esperada'] = _histograma(result['mejora_esperada'])
+        graficos['barras']['Intervención recomendada'] = _limitar(
+            result['intervencion_recomendada'].value_counts()
+        )
+
+    elif key in ('enfermedades_colores', 'rotacion_colores'):
+        columna = 'riesgo_enfermedad' if key == 'enfermedades_colores' else 'riesgo_rotacion'
+        if columna in result.columns:
+            bandas = result[columna].astype(str).value_counts().reindex(BANDAS, fill_value=0)
+            graficos['conteos']['bandas'] = bandas
+            graficos['barras']['Distribución de Riesgos'] = bandas
+            if areas is not None:
+                graficos['heatmaps']['Banda de riesgo por área'] = _tabla_cruzada(
+                    areas, result[columna].astype(str), columnas_fijas=BANDAS
+                )
+                flags = [f for f in FLAGS_MAPA if f in result.columns]
+                if flags:
+                    tasas = result[flags].groupby(areas).mean().rename(columns=FLAGS_MAPA)
+                    graficos['heatmaps']['Factores de riesgo por área'] = _limitar_filas(
+                        tasas, areas.value_counts()
+                    )
+
+    elif key == 'simulacion' and 'reduccion_total' in result.columns and len(result) > 0:
+        comparacion = result.pivot(index='area_trabajo', columns='intervencion', values='reduccion_total')
+        comparacion = _limitar_filas(comparacion, result.groupby('area_trabajo')['colaboradores']
+                                     .first().sort_values(ascending=False))
+        graficos['barras']['Reducción de Riesgo por Intervención (puntos %)'] = comparacion * 100
+        graficos['heatmaps']['Reducción de riesgo alto por área e intervención'] = comparacion
+
+    return graficos
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def figura_heatmap(tabla, titulo, cmap='RdYlGn_r', formato='{:.0%}'):
+    """PNG del mapa de calor; se cachea por contenido de la tabla y estilo"""
+    filas, columnas = tabla.shape
+    figura = Figure(figsize=(max(4, 1.1 * columnas + 2), max(2.5, 0.4 * filas + 1.2)), dpi=100)
+    ax = figura.subplots()
+    valores = tabla.to_numpy(dtype=float)
+    imagen = ax.imshow(valores, cmap=cmap, aspect='auto')
+    ax.set_xticks(range(columnas), [_texto(c) for c in tabla.columns], rotation=30, ha='right')
+    ax.set_yticks(range(filas), [_texto(i) for i in tabla.index])
+    if filas * columnas <= 400:
+        for i in range(filas):
+            for j in range(columnas):
+                if np.isfinite(valores[i, j]):
+                    ax.text(j, i, formato.format(valores[i, j]), ha='center', va='center', fontsize=8)
+    ax.set_title(_texto(titulo))
+    figura.colorbar(imagen, ax=ax)
+    figura.tight_layout()
+    return _a_png(figura)
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def figura_histograma(conteos, bordes, titulo, color='#764ba2'):
+    """PNG del histograma precalculado; se cachea por contenido y estilo"""
+    figura = Figure(figsize=(6, 3), dpi=100)
+    ax = figura.subplots()
+    ax.bar(bordes[:-1], conteos, width=np.diff(bordes), align='edge', color=color, edgecolor='white')
+    ax.set_title(_texto(titulo))
+    ax.set_ylabel('Colaboradores')
+    figura.tight_layout()
+    return _a_png(figura)
+
+
+def mostrar_visualizaciones(graficos):
+    """Mapas de calor e histogramas (imágenes cacheadas) de un resultado"""
+    if not graficos['heatmaps'] and not graficos['histogramas']:
+        return
+    with st.expander("🗺️ Mapas de calor y distribuciones", expanded=False):
+        for titulo, tabla in graficos['heatmaps'].items():
+            formato = '{:.0%}' if np.nanmax(np.abs(tabla.to_numpy(dtype=float)), initial=0) <= 1 else '{:.0f}'
+            st.image(figura_heatmap(tabla, titulo, formato=formato))
+        for titulo, (conteos, bordes) in graficos['histogramas'].items():
+            st.image(figura_histograma(conteos, bordes, titulo))
+
+
+def _tabla_cruzada(filas, columnas, columnas_fijas=None):
+    """Proporción de cada categoría de `columnas` dentro de cada fila (top filas por tamaño)"""
+    tabla = pd.crosstab(np.asarray(filas), np.asarray(columnas), normalize='index')
+    if columnas_fijas is not None:
+        tabla = tabla.reindex(columns=columnas_fijas, fill_value=0)
+    return _limitar_filas(tabla, pd.Series(np.asarray(filas)).value_counts())
+
+
+def _limitar_filas(tabla, tamanos):
+    """Conservar las MAX_CATEGORIAS filas más numerosas"""
+    if len(tabla) <= MAX_CATEGORIAS:
+        return tabla
+    return tabla.loc[tamanos.index[:MAX_CATEGORIAS].intersection(tabla.index)]
+
+
+def _limitar(serie):
+    """Recortar series con muchas categorías a las MAX_CATEGORIAS mayores"""
+    if len(serie) <= MAX_CATEGORIAS:
+        return serie
+    return serie.sort_values(ascending=False).head(MAX_CATEGORIAS)
+
+
+def _histograma(serie):
+    """Agrupar en intervalos (enteros si el rango es pequeño) antes de graficar"""
+    valores = pd.to_numeric(serie, errors='coerce').to_numpy(dtype=float)
+    valores = valores[np.isfinite(valores)]
+    if len(valores) == 0:
+        return np.zeros(1), np.array([0.0, 1.0])
+    minimo, maximo = valores.min(), valores.max()
+    if np.all(valores == np.round(valores)) and maximo - minimo < MAX_BINS:
+        bordes = np.arange(minimo, maximo + 2) - 0.5
+    else:
+        bordes = np.histogram_bin_edges(valores, bins=MAX_BINS)
+    conteos, bordes = np.histogram(valores, bins=bordes)
+    return conteos, bordes
+
+
+def _texto(valor):
+    return _EMOJIS.sub('', str(valor)).strip()
+
+
+def _a_png(figura):
+    salida = io.BytesIO()
+    figura.savefig(salida, format='png')
+    return salida.getvalue()
@@ -0,0 +1,5 @@
+# tests/conftest.py
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'modules'))
@@ -0,0 +1,63 @@
+# tests/test_cohort_index.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from cohort_index import CohortIndex
+from ml_applications import PsychosocialAnalyzer
+
+
+@pytest.fixture(scope='module')
+def datos():
+    rng = np.random.default_rng(7)
+    n = 1013  # no múltiplo de 8: el último byte del bitset queda incompleto
+    niveles = ['Bajo', 'Medio', 'Alto', 'Muy Alto', None]
+    return pd.DataFrame({
+        'area_trabajo': rng.choice(['Académica', 'Administrativa', 'Operativa'], n),
+        'tipo_contrato': rng.choice(['Indefinido', 'Plazo fijo'], n),
+        'nivel_estres': rng.choice(niveles, n),
+        'demandas_jornada': rng.choice(niveles, n),
+        'satisfaccion_laboral': rng.choice([1, 3, 4, 5, 8, np.nan], n),
+        'ausentismo_dias': rng.integers(0, 12, n),
+        'antiguedad_meses': rng.integers(1, 60, n),
+    }, index=pd.RangeIndex(100, 100 + n))
+
+
+@pytest.fixture(scope='module')
+def indice(datos):
+    return CohortIndex.desde_datos(datos, PsychosocialAnalyzer())
+
+
+@pytest.fixture(scope='module')
+def resultados(datos):
+    analyzer = PsychosocialAnalyzer()
+    enfermedad = analyzer.detector_enfermedades_colores(datos)
+    rotacion = analyzer.predictor_rotacion_colores(datos)
+    return enfermedad.join(rotacion[['punto_rot_satisfaccion', 'punto_rot_antiguedad', 'riesgo_rotacion']])
+
+
+def test_conteo_total(indice, datos):
+    assert indice.contar() == len(datos)
+
+
+def test_flags_y_exclusiones_igual_a_filtros_pandas(indice, resultados):
+    mascara = ((resultados['punto_estres'] == 1) & (resultados['punto_demandas'] == 1)
+               & (resultados['punto_rot_antiguedad'] != 1))
+    consulta = dict(todas=['punto_estres', 'punto_demandas'], ninguna=['punto_rot_antiguedad'])
+    assert indice.contar(**consulta) == mascara.sum()
+    assert indice.filas(**consulta).equals(resultados.index[mascara.to_numpy()])
+
+
+def test_categorias_igual_a_filtros_pandas(indice, resultados):
+    bits = indice.consultar(todas=['punto_satisfaccion'])
+    bits &= indice.consultar(alguna=['area_trabajo=Operativa', 'area_trabajo=Académica'])
+    bits &= indice.consultar(alguna=['riesgo_rotacion=🔴 Alto'])
+    mascara = ((resultados['punto_satisfaccion'] == 1)
+               & resultados['area_trabajo'].isin(['Operativa', 'Académica'])
+               & (resultados['riesgo_rotacion'].astype(str) == '🔴 Alto'))
+    assert indice.contar(bits) == mascara.sum()
+    assert indice.filas(bits).equals(resultados.index[mascara.to_numpy()])
+
+
+def test_cohorte_vacia(indice):
+    assert indice.contar(todas=['tipo_contrato=Indefinido', 'tipo_contrato=Plazo fijo']) == 0
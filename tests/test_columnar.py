@@ -0,0 +1,57 @@
+# tests/test_columnar.py
+import numpy as np
+import pandas as pd
+
+import columnar
+
+
+def test_pandas_sin_texto_arrow_usa_object(monkeypatch):
+    original = pd.StringDtype
+
+    def string_dtype_pandas_20(storage=None, **kwargs):
+        # pandas 2.0: sin na_value ni almacenamiento 'pyarrow_numpy'
+        if kwargs:
+            raise TypeError("unexpected keyword argument 'na_value'")
+        if storage == 'pyarrow_numpy':
+            raise ValueError("Storage must be 'python' or 'pyarrow'")
+        return original(storage)
+
+    monkeypatch.setattr(pd, 'StringDtype', string_dtype_pandas_20)
+    assert columnar._dtype_texto() == object
+
+    monkeypatch.setattr(columnar, 'TEXTO_ARROW', np.dtype(object))
+    df = pd.DataFrame({'area_trabajo': np.array(['A', 'B'], dtype=object), 'n': [1, 2]})
+    assert columnar.a_columnar(df) is df
+
+
+def test_a_columnar_convierte_solo_texto():
+    df = pd.DataFrame({'area_trabajo': np.array(['A', None], dtype=object),
+                       'mixta': np.array(['A', 1], dtype=object), 'n': [1, 2]})
+    resultado = columnar.a_columnar(df)
+    assert resultado['area_trabajo'].dtype == columnar.TEXTO_ARROW
+    assert resultado['mixta'].dtype == object
+    assert np.shares_memory(resultado['n'].to_numpy(), df['n'].to_numpy())
+
+
+def test_exportar_csv_formato_arrow():
+    df = columnar.a_columnar(pd.DataFrame({
+        'nombre': np.array(['Ana, M.', 'Luis "L"', None], dtype=object),
+        'n': [1, 2, 3],
+        'x': [3.0, 2.5, np.nan],
+        'b': [True, False, True],
+        'riesgo': pd.Categorical(['🟢 Bajo', '🔴 Alto', '🟢 Bajo']),
+    }))
+    assert columnar.exportar_csv(df).decode('utf-8') == (
+        '"nombre","n","x","b","riesgo"\n'
+        '"Ana, M.",1,3,true,"🟢 Bajo"\n'
+        '"Luis ""L""",2,2.5,false,"🔴 Alto"\n'
+        ',3,,true,"🟢 Bajo"\n'
+    )
+
+
+def test_exportar_csv_tipos_mezclados_usa_to_csv():
+    df = pd.DataFrame({'mixta': np.array(['A', 1, None], dtype=object), 'x': [3.0, 1.5, 2.0],
+                       'b': [True, False, True]})
+    salida = columnar.exportar_csv(df)
+    assert salida == df.to_csv(index=False).encode('utf-8')
+    assert salida.decode('utf-8').replace('\r\n', '\n') == 'mixta,x,b\nA,3.0,True\n1,1.5,False\n,2.0,True\n'
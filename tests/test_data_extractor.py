@@ -0,0 +1,94 @@
+# tests/test_data_extractor.py
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from data_extractor import DocumentProcessor
+
+ENCABEZADO = ['id_colaborador', 'nombre', 'comentario', 'area_trabajo', 'nivel_estres',
+              'satisfaccion_laboral']
+PROYECCION = ['nivel_estres', 'id_colaborador', 'area_trabajo', 'satisfaccion_laboral']
+
+
+@pytest.fixture
+def libro(tmp_path):
+    """Libro con título sobre el encabezado, hojas repetidas, una hoja de notas y otra con columnas reordenadas"""
+    wb = Workbook()
+    norte = wb.active
+    norte.title = 'Norte'
+    norte.append(['Reporte de riesgo psicosocial - Región Norte'])
+    norte.append([])
+    norte.append(ENCABEZADO)
+    norte.append([1, 'Ana Gómez', 'ok', 'Operativa', 'Alto', 4])
+    norte.append([])
+    norte.append([2, 'Luis Rojas', None, 'Académica', 'Bajo', 8])
+    norte.append([None, None, 'solo comentario', None, None, None])
+    norte.append([3, 'Marta Díaz', None, None, 'Medio', None])
+
+    sur = wb.create_sheet('Sur')
+    sur.append(['Reporte de riesgo psicosocial - Región Sur'])
+    sur.append([])
+    sur.append(ENCABEZADO)
+    sur.append([4, 'Pedro Soto', 'x', 'Comercial', 'Muy Alto', 2])
+    sur.append([5, 'Rosa Vera', None, 'Operativa', 'Bajo', 9])
+
+    notas = wb.create_sheet('Notas')
+    notas.append(['Este libro se generó automáticamente'])
+    notas.append(['Contacto: rrhh@ejemplo.com'])
+
+    centro = wb.create_sheet('Centro')
+    centro.append(['satisfaccion_laboral', 'area_trabajo', 'id_colaborador', 'nivel_estres'])
+    centro.append([7, 'Administrativa', 6, 'Alto'])
+    centro.append([None, None, None, None])
+    centro.append([5, 'Operativa', 7, 'Medio'])
+
+    ruta = tmp_path / 'regiones.xlsx'
+    wb.save(ruta)
+    return ruta
+
+
+def _esperado(ruta, columnas):
+    """Cada hoja leída con pd.read_excel, proyectada y sin filas vacías"""
+    partes = []
+    for hoja, encabezado in [('Norte', 2), ('Sur', 2), ('Centro', 0)]:
+        df = pd.read_excel(ruta, sheet_name=hoja, header=encabezado)
+        if columnas is not None:
+            df = df[[c for c in columnas if c in df.columns]]
+        partes.append(df.dropna(how='all'))
+    df = pd.concat(partes, ignore_index=True)
+    if columnas is not None:
+        df = df[[c for c in columnas if c in df.columns]]
+    return df
+
+
+def _comparable(df):
+    return df.astype(object).where(df.notna(), None)
+
+
+def test_proyeccion_igual_a_read_excel_por_hoja(libro):
+    resultado = DocumentProcessor().extract_from_excel_streaming(libro, PROYECCION)
+    esperado = _esperado(libro, PROYECCION)
+    assert list(resultado.columns) == PROYECCION
+    pd.testing.assert_frame_equal(_comparable(resultado), _comparable(esperado))
+    assert resultado['id_colaborador'].tolist() == [1, 2, 3, 4, 5, 6, 7]
+
+
+def test_sin_proyeccion_lee_todas_las_columnas(libro):
+    resultado = DocumentProcessor().extract_from_excel_streaming(libro)
+    esperado = _esperado(libro, None)
+    assert list(resultado.columns) == ENCABEZADO
+    pd.testing.assert_frame_equal(_comparable(resultado), _comparable(esperado))
+
+
+def test_filas_solo_con_columnas_no_proyectadas_se_descartan(libro):
+    # La fila de 'Norte' que solo tiene comentario no aporta valores proyectados.
+    # 'Centro' no tiene 'nombre': con una sola columna buscada no se reconoce su encabezado
+    resultado = DocumentProcessor().extract_from_excel_streaming(libro, ['id_colaborador', 'nombre'])
+    assert resultado['nombre'].tolist() == ['Ana Gómez', 'Luis Rojas', 'Marta Díaz', 'Pedro Soto', 'Rosa Vera']
+    assert resultado['id_colaborador'].tolist() == [1, 2, 3, 4, 5]
+
+
+def test_sin_columnas_coincidentes(libro):
+    resultado = DocumentProcessor().extract_from_excel_streaming(libro, ['no_existe'])
+    assert resultado.empty
+    assert list(resultado.columns) == ['no_existe']
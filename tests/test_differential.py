@@ -0,0 +1,46 @@
+# tests/test_differential.py
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'benchmarks'))
+
+from bench_differential import (APPS, MotorVectorizado, cargar_checksums, diferencias, generar_datos,
+                                verificar_referencia)
+from ml_applications import PsychosocialAnalyzer
+from reference_analyzer import ReferenceAnalyzer
+
+FILAS, SEED = 1000, 0
+
+
+@pytest.fixture(scope='module')
+def datos():
+    return generar_datos(FILAS, SEED)
+
+
+@pytest.fixture(scope='module')
+def salidas(datos):
+    referencia = ReferenceAnalyzer()
+    return {app: getattr(referencia, app)(datos) for app in APPS}
+
+
+def test_referencia_igual_a_salidas_congeladas(datos, salidas):
+    errores, _ = verificar_referencia(cargar_checksums(), FILAS, SEED, datos, salidas)
+    assert errores == []
+
+
+def test_cambio_en_la_referencia_se_detecta(datos, salidas):
+    alteradas = dict(salidas)
+    enfermedad = salidas['detector_enfermedades_colores'].copy()
+    enfermedad['riesgo_enfermedad'] = enfermedad['riesgo_enfermedad'].shift(1)
+    alteradas['detector_enfermedades_colores'] = enfermedad
+    errores, _ = verificar_referencia(cargar_checksums(), FILAS, SEED, datos, alteradas)
+    assert errores == ["la referencia cambió en detector_enfermedades_colores"]
+
+
+@pytest.mark.parametrize('motor', [PsychosocialAnalyzer, MotorVectorizado])
+def test_motores_sin_diferencias(datos, salidas, motor):
+    candidato = motor()
+    for app, columnas in APPS.items():
+        assert diferencias(salidas[app], getattr(candidato, app)(datos), columnas) == {}
@@ -0,0 +1,83 @@
+# tests/test_exploratory_sampling.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from exploratory_sampling import COLUMNAS_DISENO, StratifiedSampler
+
+
+def _poblacion(n, seed=0):
+    rng = np.random.default_rng(seed)
+    area = rng.choice(['Académica', 'Administrativa', 'Operativa', 'Comercial'], n, p=[0.5, 0.3, 0.15, 0.05])
+    contrato = rng.choice(['Indefinido', 'Plazo fijo'], n, p=[0.8, 0.2])
+    # Tasa de riesgo distinta por área para que la estratificación importe
+    tasa = pd.Series(area).map({'Académica': 0.1, 'Administrativa': 0.2,
+                                'Operativa': 0.4, 'Comercial': 0.02}).to_numpy()
+    return pd.DataFrame({'area_trabajo': area, 'tipo_contrato': contrato,
+                         'riesgo': rng.random(n) < tasa}, index=pd.RangeIndex(10, 10 + n))
+
+
+def test_asignacion_proporcional_con_minimo():
+    datos = _poblacion(50000)
+    muestra = StratifiedSampler(n_objetivo=1000, min_por_estrato=5).muestrear(datos)
+
+    assert muestra.index.is_unique and muestra.index.isin(datos.index).all()
+    assert abs(len(muestra) - 1000) <= 8
+    poblacion = datos.groupby(['area_trabajo', 'tipo_contrato']).size()
+    obtenidos = muestra.groupby(['area_trabajo', 'tipo_contrato']).size()
+    esperados = np.maximum(np.round(poblacion * 1000 / len(datos)), 5)
+    assert obtenidos.reindex(poblacion.index).tolist() == esperados.astype(int).tolist()
+    # Las columnas de diseño coinciden con los conteos reales
+    por_estrato = muestra.groupby('_estrato').agg(n=('_n_estrato', 'first'), filas=('_n_estrato', 'size'))
+    assert (por_estrato['n'] == por_estrato['filas']).all()
+
+
+def test_poblacion_pequena_se_toma_completa():
+    datos = _poblacion(300)
+    sampler = StratifiedSampler(n_objetivo=2000)
+    muestra = sampler.muestrear(datos)
+    assert muestra.index.equals(datos.index)
+    estimacion = sampler.estimar_tasa(muestra['riesgo'], muestra).iloc[0]
+    assert estimacion['tasa'] == pytest.approx(datos['riesgo'].mean())
+    assert estimacion['ic_inferior'] == pytest.approx(estimacion['ic_superior'])
+
+
+def test_misma_semilla_misma_muestra():
+    datos = _poblacion(20000)
+    a = StratifiedSampler(n_objetivo=500, seed=3).muestrear(datos)
+    b = StratifiedSampler(n_objetivo=500, seed=3).muestrear(datos)
+    c = StratifiedSampler(n_objetivo=500, seed=4).muestrear(datos)
+    assert a.index.equals(b.index)
+    assert not a.index.equals(c.index)
+
+
+@pytest.mark.parametrize('por', [None, 'tipo_contrato'])
+def test_cobertura_de_intervalos(por):
+    datos = _poblacion(40000, seed=1)
+    verdad = datos['riesgo'].groupby(datos[por] if por else np.full(len(datos), 'Total')).mean()
+    cubiertos, total = 0, 0
+    for seed in range(200):
+        sampler = StratifiedSampler(n_objetivo=400, seed=seed)
+        muestra = sampler.muestrear(datos)
+        grupos = muestra[por] if por else None
+        tasas = sampler.estimar_tasa(muestra['riesgo'], muestra, por=grupos)
+        dentro = (tasas['ic_inferior'] <= verdad) & (verdad <= tasas['ic_superior'])
+        cubiertos += int(dentro.sum())
+        total += len(tasas)
+    assert cubiertos / total >= 0.92
+
+
+def test_evento_raro_sin_casos_tiene_intervalo_positivo():
+    datos = _poblacion(100000)
+    datos['raro'] = False
+    datos.iloc[::2000, datos.columns.get_loc('raro')] = True
+    sampler = StratifiedSampler(n_objetivo=300, seed=0)
+    muestra = sampler.muestrear(datos)
+    estimacion = sampler.estimar_tasa(muestra['raro'], muestra).iloc[0]
+    assert estimacion['ic_inferior'] <= datos['raro'].mean() <= estimacion['ic_superior']
+    assert estimacion['ic_superior'] > estimacion['tasa']
+
+
+def test_columnas_de_diseno():
+    muestra = StratifiedSampler(n_objetivo=100).muestrear(_poblacion(1000))
+    assert set(COLUMNAS_DISENO) <= set(muestra.columns)
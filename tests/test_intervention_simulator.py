@@ -0,0 +1,63 @@
+# tests/test_intervention_simulator.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from intervention_simulator import InterventionSimulator, VARIABLES
+from ml_applications import PsychosocialAnalyzer
+
+BANDAS = ['🟢 Bajo', '🟡 Medio', '🔴 Alto']
+
+
+def _datos(n=3000, seed=0):
+    """Valores en los bordes de cada umbral, niveles desconocidos y faltantes"""
+    rng = np.random.default_rng(seed)
+    niveles = np.array(['Bajo', 'Medio', 'Alto', 'Muy Alto', 'N/A', None], dtype=object)
+    return pd.DataFrame({
+        'area_trabajo': rng.choice(['Académica', 'Operativa', 'Comercial'], n),
+        'nivel_estres': rng.choice(niveles, n),
+        'demandas_jornada': rng.choice(niveles, n),
+        'satisfaccion_laboral': rng.choice([1, 3, 3.5, 4, 4.5, 5, 6, 10, np.nan], n),
+        'ausentismo_dias': rng.choice([0, 4, 5, 6, 12], n),
+        'antiguedad_meses': rng.choice([1, 11, 12, 13, 60], n),
+    })
+
+
+@pytest.mark.parametrize('faltante', [None] + VARIABLES)
+def test_sin_intervencion_igual_a_apps_de_colores(faltante):
+    datos = _datos()
+    if faltante:
+        datos = datos.drop(columns=faltante)
+    simulador = InterventionSimulator()
+    banda_enf, banda_rot, _ = simulador.simular(datos)
+    base = simulador.nombres.index('Sin intervención')
+
+    analyzer = PsychosocialAnalyzer()
+    enfermedad = analyzer.detector_enfermedades_colores(datos)['riesgo_enfermedad'].astype(str)
+    rotacion = analyzer.predictor_rotacion_colores(datos)['riesgo_rotacion'].astype(str)
+    assert (np.array(BANDAS)[banda_enf[base]] == enfermedad.to_numpy()).all()
+    assert (np.array(BANDAS)[banda_rot[base]] == rotacion.to_numpy()).all()
+
+
+def test_escenario_igual_a_apps_sobre_datos_modificados():
+    datos = _datos()
+    simulador = InterventionSimulator({'Capacitación': {'nivel_estres': -1}})
+    banda_enf, _, _ = simulador.simular(datos)
+
+    bajar = {'Muy Alto': 'Alto', 'Alto': 'Medio', 'Medio': 'Bajo', 'Bajo': 'Bajo'}
+    modificados = datos.assign(nivel_estres=datos['nivel_estres'].map(bajar))
+    esperado = PsychosocialAnalyzer().detector_enfermedades_colores(modificados)['riesgo_enfermedad']
+    indice = simulador.nombres.index('Capacitación')
+    assert (np.array(BANDAS)[banda_enf[indice]] == esperado.astype(str).to_numpy()).all()
+
+
+def test_ranking_por_area_cuenta_riesgo_alto():
+    datos = _datos()
+    ranking = InterventionSimulator().ranking_por_area(datos)
+    enfermedad = PsychosocialAnalyzer().detector_enfermedades_colores(datos)
+    tasa_base = (enfermedad['riesgo_enfermedad'].astype(str) == '🔴 Alto').groupby(datos['area_trabajo']).mean()
+    fila = ranking[ranking['intervencion'] == 'Capacitación'].set_index('area_trabajo')
+    reconstruida = fila['riesgo_enfermedad_alto'] + fila['reduccion_enfermedad']
+    pd.testing.assert_series_equal(reconstruida.sort_index(), tasa_base.sort_index(),
+                                   check_names=False)
+    assert (ranking.groupby('area_trabajo')['ranking'].min() == 1).all()
@@ -0,0 +1,88 @@
+# tests/test_record_linkage.py
+from difflib import SequenceMatcher
+
+import numpy as np
+import pandas as pd
+
+from record_linkage import RecordLinker
+
+
+def _personas(ids, nombres, area='Operativa'):
+    return pd.DataFrame({'id_colaborador': ids, 'nombre': nombres, 'area_trabajo': area})
+
+
+def test_mismo_id_entre_fuentes_se_fusiona():
+    a = _personas([1, 2], ['Ana Gómez', 'Luis Rojas'])
+    b = _personas([1, 3], ['Ana Gomez', 'Marta Díaz'])
+    canonica, linaje = RecordLinker().vincular([('a', a), ('b', b)])
+    assert len(canonica) == 3
+    assert len(linaje) == 4
+    fila = canonica[canonica['id_colaborador'] == 1].iloc[0]
+    assert fila['registros_origen'] == 2
+    assert fila['fuentes_origen'] == 'a; b'
+    assert canonica.set_index('id_colaborador')['fuentes_origen'].to_dict() == {1: 'a; b', 2: 'a', 3: 'b'}
+
+
+def test_nombre_con_errores_sin_id_se_fusiona():
+    a = _personas([1], ['Juan Pérez'])
+    b = _personas([np.nan], ['juan  perez'])
+    canonica, _ = RecordLinker().vincular([('a', a), ('b', b)])
+    assert len(canonica) == 1
+
+
+def test_nombres_similares_con_ids_distintos_no_se_fusionan():
+    a = _personas([1, 2], ['Juan Pérez', 'Juan Perez'])
+    canonica, _ = RecordLinker().vincular([('a', a)])
+    assert len(canonica) == 2
+
+
+def test_registro_sin_id_no_une_dos_ids_distintos():
+    datos = _personas([1, np.nan, 4], ['Juan Pérez', 'Juan Peres', 'Juan Perez'])
+    canonica, _ = RecordLinker().vincular([('a', datos)])
+    assert sorted(canonica['id_colaborador']) == [1, 4]
+    assert canonica['registros_origen'].sum() == 3
+
+
+def test_nombres_con_numeros_distintos_no_se_fusionan():
+    datos = _personas([np.nan] * 3, ['Colaborador_1', 'Colaborador_2', 'Colaborador_12'])
+    canonica, _ = RecordLinker().vincular([('a', datos)])
+    assert len(canonica) == 3
+
+
+def test_sin_encadenamiento_de_nombres():
+    # Cada nombre se parece al siguiente, pero los extremos no se parecen entre sí
+    nombres = ['Ana Martinez', 'Ana Martines', 'Ana Marines', 'Ana Marinos', 'Ama Marinos', 'Ama Morinos']
+    datos = _personas([np.nan] * len(nombres), nombres)
+    linker = RecordLinker(umbral_nombre=0.85)
+    canonica, linaje = linker.vincular([('a', datos)])
+    assert len(canonica) > 1
+    # Todos los nombres de cada grupo superan el umbral entre sí
+    for _, grupo in linaje.groupby('id_canonico'):
+        idx = grupo['fila_fuente'].tolist()
+        for i in idx:
+            for j in idx:
+                ratio = SequenceMatcher(None, nombres[i].lower(), nombres[j].lower()).ratio()
+                assert ratio >= 0.85
+
+
+def test_colaboradores_numerados_no_colapsan():
+    n = 2000
+    fuentes = [(f, _personas([np.nan] * n, [f'Colaborador_{i}' for i in range(n)])) for f in 'ab']
+    linker = RecordLinker()
+    canonica, _ = linker.vincular(fuentes)
+    assert len(canonica) == n
+    assert canonica['registros_origen'].eq(2).all()
+
+
+def test_nulos_del_representante_se_completan_con_el_grupo():
+    a = _personas([1, 2], ['Ana Gómez', None]).assign(edad=[np.nan, 30.0])
+    b = _personas([1, 2], ['Ana Gomez', 'Luis Rojas']).assign(edad=[41.0, 35.0])
+    canonica, _ = RecordLinker().vincular([('a', a), ('b', b)])
+    assert canonica['edad'].tolist() == [41.0, 30.0]
+    assert canonica['nombre'].tolist() == ['Ana Gómez', 'Luis Rojas']
+
+
+def test_sin_duplicados_comparte_columnas():
+    datos = _personas([1, 2, 3], ['Ana Gómez', 'Luis Rojas', 'Marta Díaz']).assign(edad=[30, 40, 50])
+    canonica, _ = RecordLinker().vincular([('a', datos)])
+    assert np.shares_memory(canonica['edad'].to_numpy(), datos['edad'].to_numpy())
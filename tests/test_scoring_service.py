@@ -0,0 +1,89 @@
+# tests/test_scoring_service.py
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from scoring_service import MicroBatcher, RegistroInvalido, crear_servidor
+
+
+@pytest.fixture(scope='module')
+def batcher():
+    batcher = MicroBatcher(espera_ms=1)
+    yield batcher
+    batcher.cerrar()
+
+
+def test_campos_ausentes_dan_el_mismo_resultado_en_cualquier_lote(batcher):
+    solo = batcher.puntuar_lote([{'id_colaborador': 1}])[0]
+    acompanado = batcher.puntuar_lote([{'id_colaborador': 1},
+                                       {'id_colaborador': 2, 'nivel_estres': 'Alto'}])[0]
+    assert solo == acompanado
+    assert solo['riesgo_alto'] == 0
+
+
+def test_numericos_en_texto_se_convierten(batcher):
+    resultado = batcher.puntuar({'satisfaccion_laboral': '3', 'ausentismo_dias': '9',
+                                 'nivel_estres': 'Alto'})
+    assert resultado['riesgo_enfermedad'] == '🔴 Alto'
+
+
+@pytest.mark.parametrize('registro', [{'satisfaccion_laboral': 'alta'}, {'nivel_estres': 3},
+                                      {'ausentismo_dias': [1]}, {'antiguedad_meses': True}])
+def test_tipos_invalidos_se_rechazan_antes_de_encolar(batcher, registro):
+    with pytest.raises(RegistroInvalido):
+        batcher.puntuar(registro)
+
+
+def test_lote_fallido_se_reintenta_por_registro(batcher, monkeypatch):
+    original = batcher.puntuar_lote
+
+    def falla_con_varios(registros):
+        if len(registros) > 1:
+            raise RuntimeError("fallo de lote")
+        return original(registros)
+
+    monkeypatch.setattr(batcher, 'puntuar_lote', falla_con_varios)
+    resultados = [None] * 8
+    barrera = threading.Barrier(8)
+
+    def enviar(i):
+        barrera.wait()
+        resultados[i] = batcher.puntuar({'id_colaborador': i})
+
+    hilos = [threading.Thread(target=enviar, args=(i,)) for i in range(8)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    assert [r['id_colaborador'] for r in resultados] == list(range(8))
+
+
+def test_http_responde_400_y_registra_listas():
+    servidor = crear_servidor(port=0, espera_ms=1)
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    url = f'http://127.0.0.1:{servidor.server_address[1]}'
+
+    def post(cuerpo):
+        solicitud = urllib.request.Request(f'{url}/score', data=json.dumps(cuerpo).encode(),
+                                           headers={'Content-Type': 'application/json'})
+        return urllib.request.urlopen(solicitud)
+
+    try:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            post({'satisfaccion_laboral': 'n/a'})
+        assert error.value.code == 400
+        with pytest.raises(urllib.error.HTTPError) as error:
+            post([{'id_colaborador': 1}, {'nivel_estres': 5}])
+        assert error.value.code == 400
+
+        antes = json.load(urllib.request.urlopen(f'{url}/stats'))['puntuados']
+        assert len(json.load(post([{'id_colaborador': 1}, {'id_colaborador': 2}]))) == 2
+        assert json.load(urllib.request.urlopen(f'{url}/stats'))['puntuados'] == antes + 2
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
+        servidor.RequestHandlerClass.batcher.cerrar()
@@ -0,0 +1,82 @@
+# tests/test_visualizations.py
+import numpy as np
+import pandas as pd
+
+from visualizations import (BANDAS, MAX_BINS, MAX_CATEGORIAS, _histograma, _limitar, _limitar_filas,
+                            preparar_graficos)
+
+
+def _poblacion(n=1000, areas=4, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'area_trabajo': rng.choice([f'Área {i}' for i in range(areas)], n),
+        'nivel_estres': rng.choice(['Bajo', 'Medio', 'Alto', 'Muy Alto'], n),
+    }, index=pd.RangeIndex(500, 500 + n))
+
+
+def test_bandas_incluyen_las_tres_etiquetas():
+    datos = _poblacion(20)
+    resultado = datos.assign(riesgo_enfermedad=pd.Categorical(['🟢 Bajo'] * 15 + ['🔴 Alto'] * 5))
+    graficos = preparar_graficos('enfermedades_colores', resultado, datos)
+    bandas = graficos['conteos']['bandas']
+    assert list(bandas.index) == BANDAS
+    assert bandas.tolist() == [15, 0, 5]
+    tabla = graficos['heatmaps']['Banda de riesgo por área']
+    assert list(tabla.columns) == BANDAS
+    assert np.allclose(tabla.sum(axis=1), 1)
+
+
+def test_histograma_limita_intervalos():
+    conteos, bordes = _histograma(pd.Series(np.random.default_rng(0).normal(size=10000)))
+    assert len(conteos) == MAX_BINS and len(bordes) == MAX_BINS + 1
+    assert conteos.sum() == 10000
+
+
+def test_histograma_enteros_en_intervalos_unitarios():
+    conteos, bordes = _histograma(pd.Series([1, 2, 2, 5, np.nan]))
+    assert bordes.tolist() == [0.5, 1.5, 2.5, 3.5, 4.5, 5.5]
+    assert conteos.tolist() == [1, 2, 0, 0, 1]
+
+
+def test_histograma_vacio():
+    conteos, bordes = _histograma(pd.Series([np.nan, None], dtype=float))
+    assert conteos.tolist() == [0] and bordes.tolist() == [0.0, 1.0]
+
+
+def test_limitar_conserva_las_categorias_mayores():
+    serie = pd.Series(np.arange(MAX_CATEGORIAS + 20), index=[f'c{i}' for i in range(MAX_CATEGORIAS + 20)])
+    limitada = _limitar(serie)
+    assert len(limitada) == MAX_CATEGORIAS
+    assert limitada.min() == 20
+    assert _limitar(serie.head(5)).equals(serie.head(5))
+
+
+def test_limitar_filas_por_tamano():
+    filas = [f'Área {i}' for i in range(MAX_CATEGORIAS + 10)]
+    tabla = pd.DataFrame({'tasa': np.linspace(0, 1, len(filas))}, index=filas)
+    tamanos = pd.Series(np.arange(len(filas)), index=filas).sort_values(ascending=False)
+    limitada = _limitar_filas(tabla, tamanos)
+    assert list(limitada.index) == list(tamanos.index[:MAX_CATEGORIAS])
+
+
+def test_demasiadas_areas_se_limitan():
+    datos = _poblacion(5000, areas=MAX_CATEGORIAS + 15)
+    resultado = datos.assign(riesgo_alto=(datos['nivel_estres'] == 'Alto').astype(int))
+    graficos = preparar_graficos('alertas', resultado, datos)
+    assert len(graficos['barras']['Riesgo por Área']) == MAX_CATEGORIAS
+    assert len(graficos['heatmaps']['Nivel de estrés por área']) == MAX_CATEGORIAS
+
+
+def test_areas_alineadas_con_resultado_de_una_muestra():
+    # Modo exploratorio: el resultado solo contiene las filas muestreadas
+    datos = _poblacion(1000)
+    muestra = datos.sample(200, random_state=1)
+    resultado = muestra.assign(riesgo_alto=(muestra['nivel_estres'] == 'Alto').astype(int))
+    graficos = preparar_graficos('alertas', resultado, datos)
+
+    esperado = resultado['riesgo_alto'].groupby(muestra['area_trabajo']).mean()
+    pd.testing.assert_series_equal(graficos['barras']['Riesgo por Área'], esperado, check_names=False)
+    esperado_tabla = pd.crosstab(muestra['area_trabajo'], muestra['nivel_estres'], normalize='index')
+    pd.testing.assert_frame_equal(graficos['heatmaps']['Nivel de estrés por área'], esperado_tabla,
+                                  check_names=False)
+    assert graficos['conteos']['riesgo_alto'] == resultado['riesgo_alto'].sum()